@@ -0,0 +1,229 @@
+# Author: Anthony Prudent
+# GitHub username: AnthonyPrudent
+# Date: 10/17/2026
+# Description: The program scores large batches of ChessVar positions at once with NumPy instead of walking the chess
+#              board of one position at a time. Positions are encoded as rows of an (N, 64) int8 array holding a code
+#              for the chess piece on every square, positive for white and negative for black, along with the fairy
+#              pieces each player has not entered yet. Material, including falcons, hunters, and fairy pieces in
+#              reserve, piece-square bonuses, and the mobility of every chess piece are computed with array operations
+#              over every position of the batch. NumPy is optional and only needed when a batch evaluator is created.
+
+from ChessEngine import PIECE_VALUES, FAIRY_RESERVE_VALUE
+from ChessVar import PIECE_TYPES, ATTACK_TABLES
+
+try:
+    import numpy
+
+except ImportError:
+    numpy = None
+
+# Code of each piece type in an encoded chess board, negated for black chess pieces, empty squares are 0
+PIECE_CODES = {piece_type: code for code, piece_type in enumerate(PIECE_TYPES, 1)}
+
+# Score of every square a chess piece can move to or capture on
+MOBILITY_WEIGHT = 4
+
+# Piece-square bonus for every step a chess piece stands closer to the center, by piece type
+_CENTER_WEIGHTS = {"knight": 5, "bishop": 3, "queen": 1, "falcon": 4, "hunter": 4}
+
+# Piece-square bonus for every row a pawn has advanced from its starting row
+_PAWN_ADVANCE_WEIGHT = 6
+
+# Code standing for the squares past the edge of the chess board, which block every ray and cannot be captured
+_EDGE_CODE = 127
+
+# Positions scored together, which bounds the size of the intermediate arrays
+_CHUNK_POSITIONS = 8192
+
+
+def encode_games(chess_games):
+    """
+    Returns the encoded chess boards, fairy reserves, and player turns of the chess games. The chess boards are an
+    (N, 64) int8 array of piece codes, the fairy reserves are an (N, 2) int8 array of the fairy pieces white and black
+    have not entered yet, and the player turns are an (N,) int8 array of 1 for white and -1 for black.
+    """
+    _require_numpy()
+    piece_codes = {}
+
+    for piece_type, code in PIECE_CODES.items():
+        piece_codes[(piece_type, "white")] = code
+        piece_codes[(piece_type, "black")] = -code
+
+    board_rows = []
+    reserve_rows = []
+    turns = []
+
+    for chess_game in chess_games:
+
+        board_rows.append([
+            0 if chess_piece is None else piece_codes[(chess_piece.get_piece_type(), chess_piece.get_player_color())]
+            for chess_piece in chess_game.get_board()
+        ])
+        reserve_rows.append([
+            2 - len(chess_game.get_fairy_pieces_played("white")), 2 - len(chess_game.get_fairy_pieces_played("black"))
+        ])
+        turns.append(1 if chess_game.get_player_turn() == "white" else -1)
+
+    boards = numpy.array(board_rows, dtype=numpy.int8).reshape(-1, 64)
+    reserves = numpy.array(reserve_rows, dtype=numpy.int8).reshape(-1, 2)
+    return boards, reserves, numpy.array(turns, dtype=numpy.int8)
+
+
+def _require_numpy():
+    """
+    Raises ImportError if NumPy is not installed.
+    """
+
+    if numpy is None:
+        raise ImportError("the batch evaluator requires NumPy")
+
+
+class BatchEvaluator:
+    """
+    Represents an evaluator of many chess positions at once. Keeps the lookup arrays of piece values, piece-square
+    bonuses, and the squares every chess piece can reach from every square, all indexed by piece code plus 8.
+    """
+
+    def __init__(self, piece_values=None, fairy_reserve_value=FAIRY_RESERVE_VALUE, mobility_weight=MOBILITY_WEIGHT):
+        """
+        Initializes the batch evaluator with the value of each piece type, the value of each fairy piece in reserve,
+        and the score of each square of mobility. The piece values default to those of the chess engine. Raises
+        ImportError if NumPy is not installed.
+        """
+        _require_numpy()
+
+        if piece_values is None:
+            piece_values = PIECE_VALUES
+
+        self._fairy_reserve_value = fairy_reserve_value
+        self._mobility_weight = mobility_weight
+        self._piece_values = numpy.zeros(17, dtype=numpy.int32)
+        self._piece_square = numpy.zeros((17, 64), dtype=numpy.int32)
+        self._ray_squares = numpy.full((17, 64, 8, 7), 64, dtype=numpy.int16)
+
+        for piece_type, code in PIECE_CODES.items():
+
+            self._piece_values[8 + code] = piece_values[piece_type]
+            self._piece_values[8 - code] = -piece_values[piece_type]
+
+            for square_index in range(64):
+
+                # Black's bonuses are white's bonuses of the square mirrored across the middle rows
+                mirrored_index = square_index ^ 56
+                self._piece_square[8 + code, square_index] = self._get_square_bonus(piece_type, square_index)
+                self._piece_square[8 - code, mirrored_index] = -self._get_square_bonus(piece_type, square_index)
+
+            # Pawn captures depend on an opposing chess piece standing on the square, so pawns have no mobility
+            if piece_type == "pawn":
+                continue
+
+            for color_code, player_color in ((8 + code, "white"), (8 - code, "black")):
+
+                for square_index, rays in enumerate(ATTACK_TABLES[(piece_type, player_color)]):
+
+                    for ray_index, ray in enumerate(rays):
+                        self._ray_squares[color_code, square_index, ray_index, :len(ray)] = ray
+
+        self._square_indexes = numpy.arange(64)
+
+    @staticmethod
+    def _get_square_bonus(piece_type, square_index):
+        """
+        Returns white's piece-square bonus of the piece type standing on the square index.
+        """
+        row_index = square_index >> 3
+        column_index = square_index & 7
+
+        if piece_type == "pawn":
+            return max(row_index - 1, 0) * _PAWN_ADVANCE_WEIGHT
+
+        # Steps from the edge towards the four center squares, from 0 on the edge to 6 in the center
+        center_steps = min(row_index, 7 - row_index) + min(column_index, 7 - column_index)
+        return center_steps * _CENTER_WEIGHTS.get(piece_type, 0)
+
+    def get_material(self, boards, reserves=None):
+        """
+        Returns an (N,) int32 array of white's material minus black's material for every encoded chess board, counting
+        the fairy pieces in reserve if the fairy reserves are given.
+        """
+        boards = numpy.asarray(boards, dtype=numpy.int8)
+        material = self._piece_values[boards.astype(numpy.intp) + 8].sum(axis=1, dtype=numpy.int32)
+
+        if reserves is not None:
+            reserves = numpy.asarray(reserves, dtype=numpy.int32)
+            material += (reserves[:, 0] - reserves[:, 1]) * self._fairy_reserve_value
+
+        return material
+
+    def get_piece_square(self, boards):
+        """
+        Returns an (N,) int32 array of white's piece-square bonuses minus black's for every encoded chess board.
+        """
+        boards = numpy.asarray(boards, dtype=numpy.int8)
+        return self._piece_square[boards.astype(numpy.intp) + 8, self._square_indexes].sum(axis=1, dtype=numpy.int32)
+
+    def get_mobility(self, boards):
+        """
+        Returns an (N, 2) int32 array of the number of empty squares white's and black's chess pieces other than pawns
+        can move to plus the number of opposing chess pieces they can capture, for every encoded chess board.
+        """
+        boards = numpy.asarray(boards, dtype=numpy.int8)
+        mobility = numpy.zeros((len(boards), 2), dtype=numpy.int32)
+
+        for start_index in range(0, len(boards), _CHUNK_POSITIONS):
+
+            chunk_boards = boards[start_index:start_index + _CHUNK_POSITIONS]
+            chunk_count = len(chunk_boards)
+
+            # Only the squares holding chess pieces other than pawns have rays to follow
+            piece_positions, piece_squares = numpy.nonzero(numpy.abs(chunk_boards) > PIECE_CODES["pawn"])
+            piece_codes = chunk_boards[piece_positions, piece_squares]
+
+            # A 65th square past the edge ends every ray shorter than seven squares
+            padded_boards = numpy.concatenate(
+                (chunk_boards, numpy.full((chunk_count, 1), _EDGE_CODE, dtype=numpy.int8)), axis=1
+            )
+            ray_squares = self._ray_squares[piece_codes.astype(numpy.intp) + 8, piece_squares]
+            ray_codes = padded_boards[piece_positions[:, None, None], ray_squares]
+
+            # Empty squares reached along each ray before the first chess piece or edge, rays ending in an empty
+            # seventh square reach all seven squares
+            ray_moves = numpy.argmax(ray_codes != 0, axis=2)
+            blockers = numpy.take_along_axis(ray_codes, ray_moves[..., None], axis=2)[..., 0]
+            ray_moves[blockers == 0] = 7
+
+            # The first chess piece along each ray is captured if it belongs to the opponent
+            ray_captures = (blockers * numpy.sign(piece_codes)[:, None] < 0) & (blockers != _EDGE_CODE)
+            piece_mobility = ray_moves.sum(axis=1) + ray_captures.sum(axis=1)
+
+            mobility[start_index:start_index + chunk_count, 0] = numpy.bincount(
+                piece_positions, piece_mobility * (piece_codes > 0), chunk_count
+            )
+            mobility[start_index:start_index + chunk_count, 1] = numpy.bincount(
+                piece_positions, piece_mobility * (piece_codes < 0), chunk_count
+            )
+
+        return mobility
+
+    def evaluate(self, boards, reserves=None, turns=None):
+        """
+        Returns an (N,) int32 array of the score of every encoded chess board, adding material, piece-square bonuses,
+        and mobility. Scores are for white, or for the player of the current turn if the player turns are given as in
+        ChessEngine.evaluate.
+        """
+        boards = numpy.asarray(boards, dtype=numpy.int8)
+        mobility = self.get_mobility(boards)
+        scores = self.get_material(boards, reserves) + self.get_piece_square(boards)
+        scores += (mobility[:, 0] - mobility[:, 1]) * self._mobility_weight
+
+        if turns is not None:
+            scores *= numpy.asarray(turns, dtype=numpy.int32)
+
+        return scores
+
+    def evaluate_games(self, chess_games):
+        """
+        Returns an (N,) int32 array of the score of every chess game for the player of its current turn.
+        """
+        boards, reserves, turns = encode_games(chess_games)
+        return self.evaluate(boards, reserves, turns)
@@ -0,0 +1,263 @@
+# Author: Anthony Prudent
+# GitHub username: AnthonyPrudent
+# Date: 10/17/2026
+# Description: The program replays and self-plays large batches of independent ChessVar games across a pool of
+#              worker processes. Games are split into chunks of consecutive game indexes so each worker receives a few
+#              large work units instead of many small ones, and the results are gathered back in game index order.
+#              Self-play games draw their random moves from a generator seeded by the batch seed and the game index,
+#              and engine self-play uses node budgets and a new transposition table for every game, so the outcomes
+#              of a batch are the same for any number of workers. Only the measured timings vary between runs.
+
+import argparse
+import concurrent.futures
+import random
+import sys
+import time
+
+from ChessEngine import ChessEngine
+from ChessVar import ChessVar
+from GameReplay import ReplayResult, replay_moves
+from TranspositionTable import TranspositionTable
+
+# Entries of the transposition table created for each engine self-play game
+_SELF_PLAY_TABLE_ENTRIES = 1 << 16
+
+
+class BatchResult:
+    """
+    Represents the aggregated results of a batch of games. Stores the result and seconds spent for every game in game
+    index order and the seconds spent on the whole batch.
+    """
+
+    def __init__(self, game_results, game_seconds, total_seconds):
+        """
+        Initializes the batch result with the list of ReplayResult objects, the list of seconds spent on each game,
+        and the seconds spent on the whole batch.
+        """
+        self._game_results = game_results
+        self._game_seconds = game_seconds
+        self._total_seconds = total_seconds
+
+    def get_game_results(self):
+        """
+        Returns the list of ReplayResult objects in game index order.
+        """
+        return self._game_results
+
+    def get_game_seconds(self):
+        """
+        Returns the list of seconds spent on each game in game index order.
+        """
+        return self._game_seconds
+
+    def get_total_seconds(self):
+        """
+        Returns the seconds spent on the whole batch, including starting the worker processes.
+        """
+        return self._total_seconds
+
+    def get_state_counts(self):
+        """
+        Returns a dictionary with the number of games that ended in each game state.
+        """
+        state_counts = {"WHITE_WON": 0, "BLACK_WON": 0, "UNFINISHED": 0}
+
+        for game_result in self._game_results:
+            state_counts[game_result.get_game_state()] += 1
+
+        return state_counts
+
+    def get_illegal_moves(self):
+        """
+        Returns a list of tuples with the game index, move index, and move text of every game's first illegal move.
+        """
+        illegal_moves = []
+
+        for game_result in self._game_results:
+
+            if game_result.get_illegal_move_index() is not None:
+                illegal_moves.append(
+                    (game_result.get_game_index(), game_result.get_illegal_move_index(), game_result.get_illegal_move())
+                )
+
+        return illegal_moves
+
+    def get_games_per_second(self):
+        """
+        Returns the number of games finished per second over the whole batch.
+        """
+
+        if self._total_seconds <= 0:
+            return None
+
+        return len(self._game_results) / self._total_seconds
+
+
+def run_replay_batch(games, max_workers=None, chunk_size=64):
+    """
+    Replays every game, given as a list of move texts such as "e2 e4" or "F c1", and returns the BatchResult. The games
+    are split into chunks of chunk size games that are replayed by up to max workers processes, or by the current
+    process if max workers is 1.
+    """
+    work_units = []
+    chunk = []
+    start_index = 0
+
+    for game in games:
+
+        chunk.append(list(game))
+
+        if len(chunk) == chunk_size:
+            work_units.append((start_index, chunk))
+            start_index += chunk_size
+            chunk = []
+
+    if chunk:
+        work_units.append((start_index, chunk))
+
+    return _run_work_units(_replay_chunk, work_units, max_workers)
+
+
+def run_self_play_batch(game_count, seed=0, max_plies=200, engine_nodes=None, opening_plies=2, max_workers=None,
+                        chunk_size=64):
+    """
+    Plays game count games from the starting position and returns the BatchResult. Each game plays random legal moves
+    drawn from a generator seeded by the seed and the game index until a king is captured or the max plies are played.
+    If engine nodes is given, only the first opening plies moves are random and every later move is searched by the
+    engine with a budget of engine nodes. The games are split into chunks of chunk size games that are played by up to
+    max workers processes, or by the current process if max workers is 1.
+    """
+    work_units = []
+
+    for start_index in range(0, game_count, chunk_size):
+        chunk_games = min(chunk_size, game_count - start_index)
+        work_units.append((start_index, chunk_games, seed, max_plies, engine_nodes, opening_plies))
+
+    return _run_work_units(_self_play_chunk, work_units, max_workers)
+
+
+def _run_work_units(worker, work_units, max_workers):
+    """
+    Runs the worker on every work unit and returns the BatchResult of the results gathered in work unit order.
+    """
+    start_time = time.perf_counter()
+    game_results = []
+    game_seconds = []
+
+    if max_workers == 1:
+        chunk_results = map(worker, work_units)
+        _gather_results(chunk_results, game_results, game_seconds)
+
+    else:
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            _gather_results(executor.map(worker, work_units), game_results, game_seconds)
+
+    return BatchResult(game_results, game_seconds, time.perf_counter() - start_time)
+
+
+def _gather_results(chunk_results, game_results, game_seconds):
+    """
+    Appends the results and seconds of every game of the chunk results to the game results and game seconds lists.
+    """
+
+    for chunk_result in chunk_results:
+
+        for game_result, seconds in chunk_result:
+            game_results.append(game_result)
+            game_seconds.append(seconds)
+
+
+def _replay_chunk(work_unit):
+    """
+    Replays the games of the work unit, returning a list of tuples of each game's ReplayResult and seconds spent.
+    """
+    start_index, games = work_unit
+    chunk_results = []
+
+    for game_offset in range(len(games)):
+        start_time = time.perf_counter()
+        game_result = replay_moves(games[game_offset], start_index + game_offset)
+        chunk_results.append((game_result, time.perf_counter() - start_time))
+
+    return chunk_results
+
+
+def _self_play_chunk(work_unit):
+    """
+    Plays the self-play games of the work unit, returning a list of tuples of each game's ReplayResult and seconds
+    spent.
+    """
+    start_index, chunk_games, seed, max_plies, engine_nodes, opening_plies = work_unit
+    chunk_results = []
+
+    for game_index in range(start_index, start_index + chunk_games):
+        start_time = time.perf_counter()
+        game_result = _self_play_game(game_index, seed, max_plies, engine_nodes, opening_plies)
+        chunk_results.append((game_result, time.perf_counter() - start_time))
+
+    return chunk_results
+
+
+def _self_play_game(game_index, seed, max_plies, engine_nodes, opening_plies):
+    """
+    Plays one self-play game and returns its ReplayResult.
+    """
+    random_generator = random.Random(seed * 1000003 + game_index)
+    chess_game = ChessVar(headless=True)
+    chess_engine = None
+    moves_made = 0
+
+    if engine_nodes is not None:
+        chess_engine = ChessEngine(TranspositionTable(_SELF_PLAY_TABLE_ENTRIES))
+
+    while moves_made < max_plies and chess_game.get_game_state() == "UNFINISHED":
+
+        if chess_engine is not None and moves_made >= opening_plies:
+            move_names = chess_engine.search(chess_game, max_nodes=engine_nodes)
+
+        else:
+            legal_moves = chess_game.generate_moves()
+            move_names = random_generator.choice(legal_moves) if legal_moves else None
+
+        if move_names is None:
+            break
+
+        if len(move_names[0]) == 1:
+            chess_game.enter_fairy_piece(move_names[0], move_names[1])
+
+        else:
+            chess_game.make_move(move_names[0], move_names[1])
+
+        moves_made += 1
+
+    return ReplayResult(game_index, None, moves_made, chess_game.get_game_state(), None, None, None)
+
+
+def main(arguments=None):
+    """
+    Plays a batch of self-play games from the command line and prints the game state counts and throughput.
+    """
+    parser = argparse.ArgumentParser(description="Self-play batches of ChessVar games across worker processes.")
+    parser.add_argument("--games", type=int, default=1000, help="number of games played")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random moves")
+    parser.add_argument("--max-plies", type=int, default=200, help="moves played before a game is left unfinished")
+    parser.add_argument("--engine-nodes", type=int, help="node budget of each engine move, random moves if omitted")
+    parser.add_argument("--workers", type=int, help="worker processes, 1 plays in this process")
+    parser.add_argument("--chunk-size", type=int, default=64, help="games in each work unit")
+    options = parser.parse_args(arguments)
+
+    batch_result = run_self_play_batch(
+        options.games, options.seed, options.max_plies, options.engine_nodes, max_workers=options.workers,
+        chunk_size=options.chunk_size
+    )
+    state_counts = batch_result.get_state_counts()
+    print(f"{len(batch_result.get_game_results())} games in {batch_result.get_total_seconds():.2f}s "
+          f"({batch_result.get_games_per_second():.1f} games/s): {state_counts['WHITE_WON']} white won, "
+          f"{state_counts['BLACK_WON']} black won, {state_counts['UNFINISHED']} unfinished")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
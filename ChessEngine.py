@@ -0,0 +1,473 @@
+# Author: Anthony Prudent
+# GitHub username: AnthonyPrudent
+# Date: 10/17/2026
+# Description: The program defines a chess engine class that finds the best move for the player of the current turn
+#              of a ChessVar game. The engine uses a negamax alpha-beta search with iterative deepening, so it always
+#              has a best move ready when its time or node budget runs out. Moves are tried with king captures first,
+#              then other captures, then quiet moves and fairy piece entries. The search explores variations through
+#              the chess game's numbered move push and pop methods, so the chess game is never copied and is left
+#              unchanged when the search returns. An endgame tablebase can be given to score solved endings exactly.
+
+import time
+
+from ChessVar import FAIRY_MOVE_BASE
+from EndgameTablebase import WIN, LOSS
+from TranspositionTable import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+
+# Value of each chess piece type, the king is worth nothing since capturing it ends the game instead
+PIECE_VALUES = {
+    "pawn": 100,
+    "knight": 300,
+    "bishop": 320,
+    "rook": 500,
+    "queen": 900,
+    "king": 0,
+    "falcon": 400,
+    "hunter": 400
+}
+
+# Value of a fairy piece a player has not entered yet
+FAIRY_RESERVE_VALUE = 50
+
+# Score of capturing the king, reduced by the number of plies needed so faster wins score higher
+WIN_SCORE = 1000000
+
+# Scores above this threshold are wins or losses rather than material evaluations
+WIN_THRESHOLD = WIN_SCORE - 1000
+
+# Number of nodes searched between reads of the clock, the node budget is checked at every node
+_CLOCK_CHECK_INTERVAL = 16
+
+
+class SearchAborted(Exception):
+    """
+    Raised inside the search when the time or node budget runs out. It never leaves ChessEngine.search.
+    """
+
+
+class ChessEngine:
+    """
+    Represents a chess engine for the ChessVar chess variation. Keeps the transposition table shared between searches
+    and the information about the most recent search. Communicates with the ChessVar class to generate, make, and
+    undo moves while searching.
+    """
+
+    def __init__(self, transposition_table=None, tablebase=None):
+        """
+        Initializes the chess engine with the transposition table to use, or a new one with the default size, and the
+        EndgameTablebase probed for the exact score of solved endings, if any.
+        """
+
+        if transposition_table is None:
+            transposition_table = TranspositionTable()
+
+        self._transposition_table = transposition_table
+        self._tablebase = tablebase
+        self._chess_game = None
+        self._nodes = 0
+        self._max_nodes = None
+        self._deadline = None
+        self._next_budget_check = 0
+        self._search_info = {}
+
+    def get_transposition_table(self):
+        """
+        Returns the transposition table used by the chess engine.
+        """
+        return self._transposition_table
+
+    def get_tablebase(self):
+        """
+        Returns the endgame tablebase probed by the chess engine, or None if it has none.
+        """
+        return self._tablebase
+
+    def get_search_info(self):
+        """
+        Returns a dictionary describing the most recent search with the best move, its score for the player who moves,
+        the deepest completed depth, the number of searched nodes, and the seconds spent.
+        """
+        return self._search_info
+
+    def search(self, chess_game, max_time=None, max_nodes=None, max_depth=64):
+        """
+        Returns the best move found for the player of the current turn as a tuple accepted by make_move or
+        enter_fairy_piece, or None if the player has no legal move. The search deepens one ply at a time until the
+        max depth is reached or the budget of max time seconds or max nodes runs out, then returns the best move of
+        the deepest search so far. The chess game is left unchanged.
+        """
+        start_time = time.perf_counter()
+        self._chess_game = chess_game
+        self._nodes = 0
+        self._max_nodes = max_nodes
+        self._deadline = None
+        self._transposition_table.new_search()
+
+        if max_time is not None:
+            self._deadline = start_time + max_time
+
+        self._next_budget_check = self._get_next_budget_check()
+
+        root_moves = self._order_moves(chess_game.generate_numbered_moves(), None)
+        best_move = None
+        best_score = 0
+        completed_depth = 0
+
+        if root_moves:
+            best_move = root_moves[0]
+
+        # A king capture wins immediately so there is nothing to search
+        if root_moves and self._is_king_capture(root_moves[0]):
+            best_score = WIN_SCORE - 1
+            root_moves = []
+
+        stack_size = chess_game.get_move_stack_depth()
+
+        for depth in range(1, max_depth + 1):
+
+            if not root_moves:
+                break
+
+            try:
+                depth_move, depth_score = self._search_root(root_moves, depth)
+
+            except SearchAborted:
+
+                # Undoes the moves of the interrupted variation
+                while chess_game.get_move_stack_depth() > stack_size:
+                    chess_game.pop_move()
+
+                break
+
+            best_move = depth_move
+            best_score = depth_score
+            completed_depth = depth
+
+            # The best move of this depth is searched first at the next depth
+            root_moves.remove(best_move)
+            root_moves.insert(0, best_move)
+
+            # Deeper searches cannot change a forced win or loss
+            if abs(best_score) >= WIN_THRESHOLD:
+                break
+
+        self._search_info = {
+            "best_move": None if best_move is None else chess_game.get_move_names(best_move),
+            "score": best_score,
+            "depth": completed_depth,
+            "nodes": self._nodes,
+            "time": time.perf_counter() - start_time
+        }
+        self._chess_game = None
+
+        return self._search_info["best_move"]
+
+    def _search_root(self, root_moves, depth):
+        """
+        Searches every root move to the given depth, returning the best numbered move and its score.
+        """
+        chess_game = self._chess_game
+        alpha = -WIN_SCORE - 1
+        beta = WIN_SCORE + 1
+        best_move = root_moves[0]
+
+        for move in root_moves:
+
+            chess_game.push_numbered_move(move)
+            score = -self._negamax(depth - 1, -beta, -alpha, 1)
+            chess_game.pop_move()
+
+            if score > alpha:
+                alpha = score
+                best_move = move
+
+        self._transposition_table.store(chess_game.get_position_hash(), depth, alpha, EXACT, best_move)
+        return best_move, alpha
+
+    def _negamax(self, depth, alpha, beta, ply):
+        """
+        Returns the score of the current position for the player of the current turn, searched to the given depth
+        with the alpha-beta window. Ply is the distance from the root used to prefer faster wins.
+        """
+        if self._nodes >= self._next_budget_check:
+            self._check_budget()
+
+        self._nodes += 1
+
+        chess_game = self._chess_game
+
+        # The previous player captured the king
+        if chess_game.get_game_state() != "UNFINISHED":
+            return -WIN_SCORE + ply
+
+        # Solved endings are scored from the tablebase without searching
+        if self._tablebase is not None:
+
+            tablebase_entry = self._tablebase.probe(chess_game)
+
+            if tablebase_entry is not None:
+                return self._get_tablebase_score(tablebase_entry, ply)
+
+        if depth <= 0:
+            return self._quiescence(alpha, beta, ply)
+
+        position_hash = chess_game.get_position_hash()
+        entry = self._transposition_table.probe(position_hash)
+        hash_move = None
+
+        if entry is not None:
+
+            hash_move = entry[4]
+
+            if entry[1] >= depth:
+
+                score = self._score_from_table(entry[2], ply)
+
+                if entry[3] == EXACT:
+                    return score
+
+                if entry[3] == LOWER_BOUND and score >= beta:
+                    return score
+
+                if entry[3] == UPPER_BOUND and score <= alpha:
+                    return score
+
+        moves = self._order_moves(chess_game.generate_numbered_moves(), hash_move)
+
+        # The player cannot move so neither side makes progress
+        if not moves:
+            return 0
+
+        # Capturing the king wins on this move
+        if self._is_king_capture(moves[0]):
+            return WIN_SCORE - ply - 1
+
+        original_alpha = alpha
+        best_score = -WIN_SCORE - 1
+        best_move = moves[0]
+
+        for move in moves:
+
+            chess_game.push_numbered_move(move)
+            score = -self._negamax(depth - 1, -beta, -alpha, ply + 1)
+            chess_game.pop_move()
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+
+                if score > alpha:
+                    alpha = score
+
+                    if alpha >= beta:
+                        break
+
+        if best_score <= original_alpha:
+            value_kind = UPPER_BOUND
+
+        elif best_score >= beta:
+            value_kind = LOWER_BOUND
+
+        else:
+            value_kind = EXACT
+
+        self._transposition_table.store(
+            position_hash, depth, self._score_to_table(best_score, ply), value_kind, best_move
+        )
+        return best_score
+
+    def _quiescence(self, alpha, beta, ply):
+        """
+        Returns the score of the current position after searching only captures, so that a position in the middle of
+        an exchange is not evaluated as if the exchange were over.
+        """
+        if self._nodes >= self._next_budget_check:
+            self._check_budget()
+
+        self._nodes += 1
+
+        chess_game = self._chess_game
+
+        if chess_game.get_game_state() != "UNFINISHED":
+            return -WIN_SCORE + ply
+
+        stand_pat = self.evaluate(chess_game)
+
+        if stand_pat >= beta:
+            return stand_pat
+
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        board = chess_game.get_board()
+        captures = []
+
+        for move in chess_game.generate_numbered_moves():
+
+            if move < FAIRY_MOVE_BASE and board[move & 63] is not None:
+                captures.append(move)
+
+        for move in self._order_moves(captures, None):
+
+            if self._is_king_capture(move):
+                return WIN_SCORE - ply - 1
+
+            chess_game.push_numbered_move(move)
+            score = -self._quiescence(-beta, -alpha, ply + 1)
+            chess_game.pop_move()
+
+            if score >= beta:
+                return score
+
+            if score > alpha:
+                alpha = score
+
+        return alpha
+
+    def evaluate(self, chess_game):
+        """
+        Returns the material score of the chess game for the player of the current turn, counting every chess piece on
+        the board and each fairy piece a player has not entered yet.
+        """
+        score = 0
+
+        for chess_piece in chess_game.get_board():
+
+            if chess_piece is None:
+                continue
+
+            if chess_piece.get_player_color() == "white":
+                score += PIECE_VALUES[chess_piece.get_piece_type()]
+
+            else:
+                score -= PIECE_VALUES[chess_piece.get_piece_type()]
+
+        fairy_pieces_entered = len(chess_game.get_fairy_pieces_played("black"))
+        fairy_pieces_entered -= len(chess_game.get_fairy_pieces_played("white"))
+        score += fairy_pieces_entered * FAIRY_RESERVE_VALUE
+
+        if chess_game.get_player_turn() == "black":
+            return -score
+
+        return score
+
+    def _order_moves(self, moves, hash_move):
+        """
+        Returns the numbered moves sorted so the hash move comes first, then king captures, then other captures with
+        the most valuable captured piece and least valuable moving piece first, then quiet moves and fairy piece
+        entries.
+        """
+        board = self._chess_game.get_board()
+        scored_moves = []
+
+        for move in moves:
+
+            if move == hash_move:
+                order = 3000000
+
+            elif move >= FAIRY_MOVE_BASE or board[move & 63] is None:
+                order = 0
+
+            elif board[move & 63].get_piece_type() == "king":
+                order = 2000000
+
+            else:
+                captured_value = PIECE_VALUES[board[move & 63].get_piece_type()]
+                moving_value = PIECE_VALUES[board[move >> 6].get_piece_type()]
+                order = 1000 + captured_value * 10 - moving_value // 10
+
+            scored_moves.append((order, move))
+
+        scored_moves.sort(key=lambda scored_move: scored_move[0], reverse=True)
+        ordered_moves = [move for order, move in scored_moves]
+
+        # The hash move is never ahead of a king capture
+        if len(scored_moves) > 1 and scored_moves[0][0] == 3000000 and self._is_king_capture(ordered_moves[1]):
+            ordered_moves[0], ordered_moves[1] = ordered_moves[1], ordered_moves[0]
+
+        return ordered_moves
+
+    def _is_king_capture(self, move):
+        """
+        Returns whether the numbered move captures the opponent's king.
+        """
+
+        if move >= FAIRY_MOVE_BASE:
+            return False
+
+        captured_piece = self._chess_game.get_piece_at(move & 63)
+        return captured_piece is not None and captured_piece.get_piece_type() == "king"
+
+    def _check_budget(self):
+        """
+        Raises SearchAborted when the deadline has passed or the node budget is spent, so a search never searches more
+        than max nodes nodes. Otherwise sets the node count of the next check.
+        """
+
+        if self._max_nodes is not None and self._nodes >= self._max_nodes:
+            raise SearchAborted()
+
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchAborted()
+
+        self._next_budget_check = self._get_next_budget_check()
+
+    def _get_next_budget_check(self):
+        """
+        Returns the node count at which the budget is checked next: after the clock check interval when there is a
+        deadline, and no later than the node budget.
+        """
+        next_budget_check = float("inf")
+
+        if self._deadline is not None:
+            next_budget_check = self._nodes + _CLOCK_CHECK_INTERVAL
+
+        if self._max_nodes is not None:
+            next_budget_check = min(next_budget_check, self._max_nodes)
+
+        return next_budget_check
+
+    @staticmethod
+    def _get_tablebase_score(tablebase_entry, ply):
+        """
+        Returns the score of a tablebase result and its plies until a king is captured, measured from the root like
+        the score of a king capture found by the search.
+        """
+        result, distance = tablebase_entry
+
+        if result == WIN:
+            return WIN_SCORE - ply - distance
+
+        if result == LOSS:
+            return -WIN_SCORE + ply + distance
+
+        return 0
+
+    @staticmethod
+    def _score_to_table(score, ply):
+        """
+        Returns the score as stored in the transposition table, with wins measured from the stored position instead
+        of from the root.
+        """
+
+        if score >= WIN_THRESHOLD:
+            return score + ply
+
+        if score <= -WIN_THRESHOLD:
+            return score - ply
+
+        return score
+
+    @staticmethod
+    def _score_from_table(score, ply):
+        """
+        Returns the score read from the transposition table measured from the root again.
+        """
+
+        if score >= WIN_THRESHOLD:
+            return score - ply
+
+        if score <= -WIN_THRESHOLD:
+            return score + ply
+
+        return score
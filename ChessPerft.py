@@ -0,0 +1,255 @@
+# Author: Anthony Prudent
+# GitHub username: AnthonyPrudent
+# Date: 10/17/2026
+# Description: The program measures the correctness and speed of the ChessVar move code. Perft counts every position
+#              reached after a given number of plies from the starting position and from positions with fairy pieces,
+#              and the counts are compared against golden values checked in below so that any change to make_move or
+#              enter_fairy_piece that accepts different moves is caught. The benchmark also measures generated moves
+#              per second and the latency percentiles of make_move, and can write every result as JSON to compare runs.
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from ChessVar import ChessVar
+
+# Benchmark positions as the moves played from the starting position, fairy piece entries use the piece letter
+PERFT_POSITIONS = {
+    "start": [],
+    "white_fairy_reserve": ["b1 c3", "d7 d5", "c3 d5", "d8 d5"],
+    "white_falcon_entered": ["b1 c3", "d7 d5", "c3 d5", "d8 d5", "F b1"],
+    "both_fairy_reserves": ["b1 c3", "g8 f6", "c3 d5", "f6 d5", "e2 e4", "d5 c3", "d2 c3", "d7 d6"]
+}
+
+# Golden perft node counts for each benchmark position, indexed by depth
+GOLDEN_PERFT = {
+    "start": [1, 20, 400, 8902, 197750, 4898614],
+    "white_fairy_reserve": [1, 21, 978, 23800, 1028403],
+    "white_falcon_entered": [1, 47, 841, 36618, 768029],
+    "both_fairy_reserves": [1, 43, 1284, 55571, 1709617]
+}
+
+
+def create_position(moves):
+    """
+    Returns a new chess game after playing the list of moves from the starting position. Each move is either the
+    current and destination square names or a fairy piece letter and enter square separated by a space.
+    """
+    chess_game = ChessVar(headless=True)
+
+    for move in moves:
+
+        first_name, second_name = move.split()
+
+        if len(first_name) == 1:
+            move_made = chess_game.enter_fairy_piece(first_name, second_name)
+
+        else:
+            move_made = chess_game.make_move(first_name, second_name)
+
+        if not move_made:
+            raise ValueError("illegal move in benchmark position: " + move)
+
+    return chess_game
+
+
+def perft(chess_game, depth):
+    """
+    Returns the number of positions reached after playing every sequence of depth legal moves from the chess game.
+    Moves are made and undone on the chess game itself, which is unchanged when perft returns.
+    """
+
+    if depth == 0:
+        return 1
+
+    moves = chess_game.generate_numbered_moves()
+
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+
+    for move in moves:
+        chess_game.push_numbered_move(move)
+        nodes += perft(chess_game, depth - 1)
+        chess_game.pop_move()
+
+    return nodes
+
+
+def perft_divide(chess_game, depth):
+    """
+    Returns a dictionary mapping every legal move name tuple of the chess game to its perft count at one less depth.
+    Used to find which move's subtree differs from a trusted count.
+    """
+    move_counts = {}
+
+    for move in chess_game.generate_numbered_moves():
+        move_names = chess_game.get_move_names(move)
+        chess_game.push_numbered_move(move)
+        move_counts[move_names] = perft(chess_game, depth - 1)
+        chess_game.pop_move()
+
+    return move_counts
+
+
+def run_perft(max_depth, position_names=None):
+    """
+    Returns a dictionary mapping every benchmark position name to the perft results up to the max depth. Each result
+    holds the depth, node count, golden node count if known, whether they match, seconds spent, and nodes per second.
+    """
+
+    if position_names is None:
+        position_names = list(PERFT_POSITIONS)
+
+    perft_results = {}
+
+    for position_name in position_names:
+
+        chess_game = create_position(PERFT_POSITIONS[position_name])
+        golden_counts = GOLDEN_PERFT.get(position_name, [])
+        position_results = []
+
+        for depth in range(1, max_depth + 1):
+
+            start_time = time.perf_counter()
+            nodes = perft(chess_game, depth)
+            seconds = time.perf_counter() - start_time
+            expected = golden_counts[depth] if depth < len(golden_counts) else None
+
+            position_results.append({
+                "depth": depth,
+                "nodes": nodes,
+                "expected": expected,
+                "matches": expected is None or expected == nodes,
+                "seconds": seconds,
+                "nodes_per_second": nodes / seconds if seconds > 0 else None
+            })
+
+        perft_results[position_name] = position_results
+
+    return perft_results
+
+
+def measure_make_move(games, max_plies, seed):
+    """
+    Returns the throughput and latency percentiles of make_move over random games. Every game starts from the starting
+    position and plays random legal moves chosen with the seeded random generator until a king is captured or the
+    max plies are played. Latencies are measured around each make_move or enter_fairy_piece call of a headless chess
+    game in microseconds.
+    """
+    random_generator = random.Random(seed)
+    latencies = []
+
+    for _ in range(games):
+
+        chess_game = ChessVar(headless=True)
+
+        for _ in range(max_plies):
+
+            legal_moves = chess_game.generate_moves()
+
+            if not legal_moves:
+                break
+
+            first_name, second_name = random_generator.choice(legal_moves)
+
+            if len(first_name) == 1:
+                start_time = time.perf_counter_ns()
+                chess_game.enter_fairy_piece(first_name, second_name)
+                latencies.append(time.perf_counter_ns() - start_time)
+
+            else:
+                start_time = time.perf_counter_ns()
+                chess_game.make_move(first_name, second_name)
+                latencies.append(time.perf_counter_ns() - start_time)
+
+            if chess_game.get_game_state() != "UNFINISHED":
+                break
+
+    latencies.sort()
+    total_seconds = sum(latencies) / 1e9
+
+    return {
+        "moves": len(latencies),
+        "moves_per_second": len(latencies) / total_seconds if total_seconds > 0 else None,
+        "p50_us": _percentile(latencies, 50) / 1000,
+        "p90_us": _percentile(latencies, 90) / 1000,
+        "p99_us": _percentile(latencies, 99) / 1000,
+        "max_us": latencies[-1] / 1000 if latencies else 0
+    }
+
+
+def _percentile(sorted_values, percent):
+    """
+    Returns the value below which the given percent of the sorted values fall, or 0 for no values.
+    """
+
+    if not sorted_values:
+        return 0
+
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * percent / 100))
+    return sorted_values[index]
+
+
+def run_benchmarks(max_depth=3, position_names=None, latency_games=50, max_plies=200, seed=0):
+    """
+    Returns a dictionary with the perft results, the make_move measurements, and the Python version used, ready to be
+    written as JSON.
+    """
+    return {
+        "python": platform.python_version(),
+        "perft": run_perft(max_depth, position_names),
+        "make_move": measure_make_move(latency_games, max_plies, seed)
+    }
+
+
+def main(arguments=None):
+    """
+    Runs the benchmarks from the command line, prints a summary, optionally writes the JSON results, and returns 1 if
+    any perft count differs from its golden value or 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Perft and throughput benchmarks for ChessVar.")
+    parser.add_argument("--depth", type=int, default=3, help="maximum perft depth")
+    parser.add_argument("--position", action="append", choices=sorted(PERFT_POSITIONS), help="benchmark position")
+    parser.add_argument("--games", type=int, default=50, help="random games played to measure make_move")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random games")
+    parser.add_argument("--json", help="file the JSON results are written to, - for standard output")
+    options = parser.parse_args(arguments)
+
+    results = run_benchmarks(options.depth, options.position, options.games, seed=options.seed)
+    mismatches = 0
+
+    for position_name, position_results in results["perft"].items():
+
+        for depth_result in position_results:
+
+            status = "ok" if depth_result["expected"] is not None else "no golden value"
+
+            if not depth_result["matches"]:
+                status = "MISMATCH expected " + str(depth_result["expected"])
+                mismatches += 1
+
+            print(f"perft {position_name} depth {depth_result['depth']}: {depth_result['nodes']} nodes "
+                  f"in {depth_result['seconds']:.3f}s ({status})", file=sys.stderr)
+
+    make_move_results = results["make_move"]
+    print(f"make_move: {make_move_results['moves']} moves, {make_move_results['moves_per_second']:.0f} moves/s, "
+          f"p50 {make_move_results['p50_us']:.1f}us, p99 {make_move_results['p99_us']:.1f}us", file=sys.stderr)
+
+    if options.json == "-":
+        json.dump(results, sys.stdout, indent=2)
+
+    elif options.json:
+
+        with open(options.json, "w") as json_file:
+            json.dump(results, json_file, indent=2)
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
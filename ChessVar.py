@@ -5,71 +5,197 @@
 #              the chess piece class initializes with a specified piece type and player color. The chess piece private
 #              data members such as max moves, move set, and symbol are modified depending on the specified piece type.
 #              The chess game class initializes the board, game state, and tracking private data members. The make move
-#              method uses recursion to move through the spaces required to reach the destination with base cases to
-#              prevent illegal moves or to handle special cases. Both classes feature get methods to access certain
-#              private data members.
+#              method validates a move against precomputed ray and knight tables in a single pass over the squares
+#              between the origin and the destination before any part of the game is changed, then handles special
+#              cases. Both classes feature get methods to access certain private data members. The chess board is
+#              stored as a list of 64 squares indexed from a1 (0) to h8 (63) and square names such as "e4" are only
+#              translated to indexes when they enter or leave the chess game class.
+
+import random
+import struct
+
+# Square names for every index of the chess board, a1 is index 0 and h8 is index 63
+SQUARE_NAMES = tuple(column + row for row in "12345678" for column in "abcdefgh")
+
+# Board index for every square name
+SQUARE_INDEXES = {square_name: index for index, square_name in enumerate(SQUARE_NAMES)}
+
+# Every chess piece type, the index of a type is its number in binary positions
+PIECE_TYPES = ("pawn", "knight", "bishop", "rook", "queen", "king", "falcon", "hunter")
+
+# Letter of every chess piece type in position strings, white pieces use the upper case letter
+PIECE_LETTERS = {
+    "pawn": "p", "knight": "n", "bishop": "b", "rook": "r", "queen": "q", "king": "k", "falcon": "f", "hunter": "h"
+}
+
+# Special pieces counted by the fairy piece check in the order they are written in positions
+_SPECIAL_PIECE_TYPES = ("queen", "rook", "bishop", "knight")
+
+# Number of bytes of a binary position
+POSITION_BYTES = 40
+
+# Column and row steps of the eight directions, indexed by direction number
+_DIRECTION_STEPS = ((0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1))
+
+# Direction numbers reached by every move set name used by the chess pieces
+_MOVE_SET_DIRECTIONS = {
+    "vertical_up": (0,),
+    "vertical_down": (4,),
+    "horizontal": (2, 6),
+    "diagonal": (1, 3, 5, 7),
+    "diagonal_up": (1, 7),
+    "diagonal_down": (3, 5)
+}
+
+
+def _build_rays():
+    """
+    Returns a tuple holding, for every square index, a tuple of the squares passed in each of the eight directions
+    until the edge of the chess board.
+    """
+    rays = []
+
+    for square_index in range(64):
+
+        square_rays = []
+
+        for column_step, row_step in _DIRECTION_STEPS:
+
+            ray = []
+            column_index = (square_index & 7) + column_step
+            row_index = (square_index >> 3) + row_step
+
+            while 0 <= column_index < 8 and 0 <= row_index < 8:
+                ray.append(row_index * 8 + column_index)
+                column_index += column_step
+                row_index += row_step
+
+            square_rays.append(tuple(ray))
+
+        rays.append(tuple(square_rays))
+
+    return tuple(rays)
+
+
+def _build_lines():
+    """
+    Returns a list indexed by origin index times 64 plus destination index holding the direction and distance
+    between both squares, or None when the squares do not share a row, column, or diagonal.
+    """
+    lines = [None] * 4096
+
+    for square_index in range(64):
+
+        for direction in range(8):
+
+            for distance, ray_index in enumerate(_RAYS[square_index][direction], 1):
+                lines[square_index * 64 + ray_index] = (direction, distance)
+
+    return lines
+
+
+def _build_knight_targets():
+    """
+    Returns a tuple holding the frozen set of squares a knight reaches from every square index.
+    """
+    knight_steps = ((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2))
+    knight_targets = []
+
+    for square_index in range(64):
+
+        targets = set()
+
+        for column_step, row_step in knight_steps:
+
+            column_index = (square_index & 7) + column_step
+            row_index = (square_index >> 3) + row_step
+
+            if 0 <= column_index < 8 and 0 <= row_index < 8:
+                targets.add(row_index * 8 + column_index)
+
+        knight_targets.append(frozenset(targets))
+
+    return tuple(knight_targets)
+
+
+_RAYS = _build_rays()
+_LINES = _build_lines()
+_KNIGHT_TARGETS = _build_knight_targets()
 
 
 class ChessPiece:
     """
     Represents a chess piece. Stores the information about the chess piece such as the type, available move set, player
     color, maximum moves that can be made, symbol representation. Communicates with the ChessVar class to initialize
-    and update the chess board and access necessary information to validate moves.
+    and update the chess board and access necessary information to validate moves. The move set is an immutable tuple
+    and the directions it allows are kept as a bitmask of direction numbers. Chess pieces other than pawns never change,
+    so chess games share a single chess piece of each type and color, see _get_chess_piece.
     """
 
+    __slots__ = ("_piece_type", "_player_color", "_max_moves", "_symbol", "_move_set", "_move_mask")
+
     def __init__(self, piece_type, player_color):
         """
         Initializes the chess piece object with the specified type and player color. Additional private data members
-        are initialized and changed depending on the type of the chess piece such as max moves, move set, and symbol.
+        are initialized and changed depending on the type of the chess piece such as max moves, move set, move mask,
+        and symbol.
         """
         self._piece_type = piece_type
         self._player_color = player_color
         self._max_moves = 7
         self._symbol = self._player_color[0].upper() + self._piece_type[0].upper()
-        self._move_set = None
+        self._move_set = ()
 
         if self._piece_type == "pawn":
             self._max_moves = 2
 
             if self._player_color == "white":
-                self._move_set = ["vertical_up"]
+                self._move_set = ("vertical_up",)
 
             else:
-                self._move_set = ["vertical_down"]
+                self._move_set = ("vertical_down",)
 
         if self._piece_type == "knight":
             self._max_moves = 3
             self._symbol = self._player_color[0].upper() + self._piece_type[0]
-            self._move_set = ["horizontal", "vertical_up", "vertical_down"]
+            self._move_set = ("horizontal", "vertical_up", "vertical_down")
 
         if self._piece_type == "king":
             self._max_moves = 1
-            self._move_set = ["diagonal", "horizontal", "vertical_up", "vertical_down"]
+            self._move_set = ("diagonal", "horizontal", "vertical_up", "vertical_down")
 
         if self._piece_type == "queen":
-            self._move_set = ["diagonal", "horizontal", "vertical_up", "vertical_down"]
+            self._move_set = ("diagonal", "horizontal", "vertical_up", "vertical_down")
 
         if self._piece_type == "rook":
-            self._move_set = ["horizontal", "vertical_up", "vertical_down"]
+            self._move_set = ("horizontal", "vertical_up", "vertical_down")
 
         if self._piece_type == "bishop":
-            self._move_set = ["diagonal"]
+            self._move_set = ("diagonal",)
 
         if self._piece_type == "falcon":
 
             if self._player_color == "white":
-                self._move_set = ["diagonal_up", "vertical_down"]
+                self._move_set = ("diagonal_up", "vertical_down")
 
             else:
-                self._move_set = ["diagonal_down", "vertical_up"]
+                self._move_set = ("diagonal_down", "vertical_up")
 
         if self._piece_type == "hunter":
 
             if self._player_color == "white":
-                self._move_set = ["vertical_up", "diagonal_down"]
+                self._move_set = ("vertical_up", "diagonal_down")
 
             else:
-                self._move_set = ["vertical_down", "diagonal_up"]
+                self._move_set = ("vertical_down", "diagonal_up")
+
+        # Sets the bit of every direction number the move set allows
+        self._move_mask = 0
+
+        for move_name in self._move_set:
+
+            for direction in _MOVE_SET_DIRECTIONS[move_name]:
+                self._move_mask |= 1 << direction
 
     def get_max_moves(self):
         """
@@ -80,8 +206,13 @@ class ChessPiece:
 
     def set_max_moves(self, amount):
         """
-        Sets the max amount moves that a chess piece can make. Used to decrease max pawn move after first.
+        Sets the max amount moves that a chess piece can make. Used to decrease max pawn move after first. Raises
+        ValueError for any other piece type, since those chess pieces are shared by every chess game.
         """
+
+        if self._piece_type != "pawn":
+            raise ValueError("only a pawn's max moves can change, not a " + self._piece_type + "'s")
+
         self._max_moves = amount
 
     def get_player_color(self):
@@ -107,28 +238,290 @@ class ChessPiece:
 
     def get_move_set(self):
         """
-        Returns the move set list of the chess piece. Used to determine which types of moves that the chess piece can
+        Returns the move set tuple of the chess piece. Used to determine which types of moves that the chess piece can
         make.
         """
         return self._move_set
 
+    def get_move_mask(self):
+        """
+        Returns the bitmask with the bit of every direction number the chess piece's move set allows. Used to check a
+        direction in constant time while validating moves.
+        """
+        return self._move_mask
+
+
+# Chess pieces shared by every chess game, keyed by piece type and player color
+_SHARED_CHESS_PIECES = {}
+
+
+def _get_chess_piece(piece_type, player_color):
+    """
+    Returns a chess piece of the piece type and player color. Pawns track whether they made their first move so a new
+    pawn is created for each call, while every other piece type is a single chess piece shared by all chess games.
+    """
+
+    if piece_type == "pawn":
+        return ChessPiece(piece_type, player_color)
+
+    chess_piece = _SHARED_CHESS_PIECES.get((piece_type, player_color))
+
+    if chess_piece is None:
+        chess_piece = ChessPiece(piece_type, player_color)
+        _SHARED_CHESS_PIECES[(piece_type, player_color)] = chess_piece
+
+    return chess_piece
+
+
+def _build_piece_directions():
+    """
+    Returns a dictionary mapping every piece type and player color pair to the frozen set of directions its move set
+    allows. Pawns only list their non-capturing direction, their capturing directions are kept separately.
+    """
+    piece_directions = {}
+
+    for piece_type in PIECE_TYPES:
+
+        for player_color in ("white", "black"):
+
+            directions = set()
+
+            for move_name in ChessPiece(piece_type, player_color).get_move_set():
+                directions.update(_MOVE_SET_DIRECTIONS[move_name])
+
+            piece_directions[(piece_type, player_color)] = frozenset(directions)
+
+    return piece_directions
+
+
+_PIECE_DIRECTIONS = _build_piece_directions()
+
+# Diagonal directions a pawn captures in for each player color
+_PAWN_CAPTURE_DIRECTIONS = {
+    "white": frozenset(_MOVE_SET_DIRECTIONS["diagonal_up"]),
+    "black": frozenset(_MOVE_SET_DIRECTIONS["diagonal_down"])
+}
+
+
+def _build_attack_tables():
+    """
+    Returns a dictionary mapping every piece type and player color pair to a tuple holding, for every square index, the
+    rays of squares the piece can capture on in the order they are reached. Rays are cut to the piece's max moves and
+    the knight's destinations are single square rays since it jumps. A pawn's rays are its diagonal capture squares.
+    """
+    attack_tables = {}
+
+    for piece_type, player_color in _PIECE_DIRECTIONS:
+
+        max_moves = ChessPiece(piece_type, player_color).get_max_moves()
+        directions = _PIECE_DIRECTIONS[(piece_type, player_color)]
+
+        if piece_type == "pawn":
+            max_moves = 1
+            directions = _PAWN_CAPTURE_DIRECTIONS[player_color]
+
+        square_rays = []
+
+        for square_index in range(64):
+
+            if piece_type == "knight":
+                rays = [(target_index,) for target_index in sorted(_KNIGHT_TARGETS[square_index])]
+
+            else:
+                rays = [_RAYS[square_index][direction][:max_moves] for direction in sorted(directions)]
+
+            square_rays.append(tuple(ray for ray in rays if ray))
+
+        attack_tables[(piece_type, player_color)] = tuple(square_rays)
+
+    return attack_tables
+
+
+def _build_pawn_push_rays():
+    """
+    Returns a dictionary mapping each player color to a tuple holding, for every square index, the squares a pawn of
+    that color passes when moving its first move's full two spaces forward.
+    """
+    pawn_push_rays = {}
+
+    for player_color in ("white", "black"):
+
+        direction = next(iter(_PIECE_DIRECTIONS[("pawn", player_color)]))
+        pawn_push_rays[player_color] = tuple(_RAYS[square_index][direction][:2] for square_index in range(64))
+
+    return pawn_push_rays
+
+
+ATTACK_TABLES = _build_attack_tables()
+PAWN_PUSH_RAYS = _build_pawn_push_rays()
+
+# Piece types whose attack rays pass over empty squares, so a change on any square of a ray changes their attacks
+_SLIDING_PIECE_TYPES = frozenset(("bishop", "rook", "queen", "falcon", "hunter"))
+
+
+def _build_attack_masks():
+    """
+    Returns a dictionary mapping every piece type and player color pair to a tuple holding, for every square index, the
+    attack rays as bitmasks. Each ray is a tuple of its bitmask and whether its square indexes increase away from the
+    piece, which tells if the nearest chess piece on the ray is its lowest or highest set bit. Pieces that are not
+    sliding have a single ray holding every square they attack, with None instead since nothing blocks it.
+    """
+    attack_masks = {}
+
+    for piece_key, square_rays in ATTACK_TABLES.items():
+
+        square_masks = []
+
+        for square_index in range(64):
+
+            ray_masks = []
+
+            for ray in square_rays[square_index]:
+
+                ray_mask = 0
+
+                for target_index in ray:
+                    ray_mask |= 1 << target_index
+
+                ray_masks.append((ray_mask, ray[0] > square_index))
+
+            if piece_key[0] not in _SLIDING_PIECE_TYPES:
+                ray_masks = [(sum(ray_mask for ray_mask, increasing in ray_masks), None)]
+
+            square_masks.append(tuple(ray_masks))
+
+        attack_masks[piece_key] = tuple(square_masks)
+
+    return attack_masks
+
+
+_ATTACK_MASKS = _build_attack_masks()
+
+# Fairy piece types in the order used to number fairy piece entries, and the letter entering each one
+_FAIRY_PIECE_TYPES = ("falcon", "hunter")
+_FAIRY_PIECE_LETTERS = {"f": "falcon", "h": "hunter"}
+
+# Square indexes of the two home ranks a player's fairy pieces enter on
+_HOME_RANK_SQUARES = {"white": tuple(range(0, 16)), "black": tuple(range(48, 64))}
+
+# Special pieces each player starts with, one queen and two each of rooks, bishops, and knights
+_SPECIAL_PIECE_COUNT = 7
+
+# Square indexes of the pawns in the starting position, white pawns first
+_START_PAWN_SQUARES = tuple(range(8, 16)) + tuple(range(48, 56))
+
+# Bitmask of every square, marking the whole chess board as changed makes the attack maps be computed from scratch
+_ALL_SQUARES = (1 << 64) - 1
+
+# Moves are numbered as origin index times 64 plus destination index, fairy piece entries start after every board move
+FAIRY_MOVE_BASE = 4096
+
+
+def _build_zobrist_keys():
+    """
+    Returns the random 64-bit keys hashed into a chess game position. The keys come from a fixed seed so that the same
+    position hashes to the same value in every process.
+    """
+    random_generator = random.Random(0x5EED_C4E5)
+    piece_keys = {}
+    special_piece_keys = {}
+    fairy_played_keys = {}
+
+    for piece_key in _PIECE_DIRECTIONS:
+        piece_keys[piece_key] = tuple(random_generator.getrandbits(64) for _ in range(64))
+
+    pawn_first_move_keys = tuple(random_generator.getrandbits(64) for _ in range(64))
+    black_turn_key = random_generator.getrandbits(64)
+
+    for player_color in ("white", "black"):
+
+        for special_piece_type in _SPECIAL_PIECE_TYPES:
+            special_piece_keys[(player_color, special_piece_type)] = tuple(
+                random_generator.getrandbits(64) for _ in range(3)
+            )
+
+        for fairy_piece_type in _FAIRY_PIECE_TYPES:
+            fairy_played_keys[(player_color, fairy_piece_type)] = random_generator.getrandbits(64)
+
+    return piece_keys, pawn_first_move_keys, black_turn_key, special_piece_keys, fairy_played_keys
+
+
+def _get_piece_hash(chess_piece, square_index):
+    """
+    Returns the hash of the chess piece standing on the square index, including a pawn's unused first move.
+    """
+    piece_type = chess_piece.get_piece_type()
+    piece_hash = _ZOBRIST_PIECES[(piece_type, chess_piece.get_player_color())][square_index]
+
+    if piece_type == "pawn" and chess_piece.get_max_moves() == 2:
+        piece_hash ^= _ZOBRIST_PAWN_FIRST_MOVE[square_index]
+
+    return piece_hash
+
+
+# Keys for each piece on each square, pawns that still have their first move, black's turn, the special pieces left
+# to each player, and each fairy piece entered by each player
+(
+    _ZOBRIST_PIECES,
+    _ZOBRIST_PAWN_FIRST_MOVE,
+    _ZOBRIST_BLACK_TURN,
+    _ZOBRIST_SPECIAL_PIECES,
+    _ZOBRIST_FAIRY_PLAYED
+) = _build_zobrist_keys()
+
+
+def _compute_position_hash(board, player_color_turn, fairy_pieces_played, play_fairy_check):
+    """
+    Returns the position hash of the given chess board, player turn, entered fairy pieces, and special pieces left
+    computed from scratch. Used when a chess game is initialized or given a new position.
+    """
+    position_hash = 0
+
+    for square_index in range(64):
+
+        chess_piece = board[square_index]
+
+        if chess_piece is not None:
+            position_hash ^= _get_piece_hash(chess_piece, square_index)
+
+    if player_color_turn == "black":
+        position_hash ^= _ZOBRIST_BLACK_TURN
+
+    for player_color in ("white", "black"):
+
+        pieces_to_check = play_fairy_check[player_color]
+
+        for special_piece_type in pieces_to_check:
+            position_hash ^= _ZOBRIST_SPECIAL_PIECES[(player_color, special_piece_type)][
+                pieces_to_check[special_piece_type]
+            ]
+
+        for fairy_piece_type in fairy_pieces_played[player_color]:
+            position_hash ^= _ZOBRIST_FAIRY_PLAYED[(player_color, fairy_piece_type)]
+
+    return position_hash
+
 
 class ChessVar:
     """
     Represents a variation of a game of chess. Creates the chess board and keeps track of player turn, board columns
     and rows, game state, special chess pieces, and chess pieces on the board. Communicates with the
-    ChessPiece class to move chess pieces on the board.
+    ChessPiece class to move chess pieces on the board. The chess board is a list of 64 squares where the index of a
+    square is its row index times eight plus its column index.
     """
 
-    def __init__(self):
+    def __init__(self, headless=False, move_callback=None, game_over_callback=None):
         """
         Initializes the chess game variation. Initializes information about the chess game such as game state,
-        player turn, chess board locations and status, and deployment of special pawns.
+        player turn, chess board locations and status, and deployment of special pawns. A headless chess game never
+        prints the chess board or game state. The move callback is called with the chess game and the move's name
+        tuple after every successful move or fairy piece entry, and the game over callback is called with the chess
+        game and the game state when a king is captured.
         """
 
         self._game_state = "UNFINISHED"
         self._player_color_turn = "white"
-        self._chess_board = {}
+        self._board = [None] * 64
         self._rows = ("1", "2", "3", "4", "5", "6", "7", "8")
         self._columns = ("a", "b", "c", "d", "e", "f", "g", "h")
         self._home_pieces_order = ("rook", "knight", "bishop", "queen", "king", "bishop", "knight", "rook")
@@ -137,26 +530,74 @@ class ChessVar:
             "black": {"queen": 1, "rook": 2, "bishop": 2, "knight": 2},
             "white": {"queen": 1, "rook": 2, "bishop": 2, "knight": 2}
         }
+        self._special_pieces_lost = {"white": 0, "black": 0}
+        self._move_stack = []
+        self._position_hash = 0
+        self._headless = headless
+        self._move_callback = move_callback
+        self._game_over_callback = game_over_callback
+        self._display_rows = [""] * 8
+        self._dirty_display_rows = 0xFF
+        self._chess_board_display = ""
+        self._attacks = [0] * 64
+        self._attacked_squares = {"white": 0, "black": 0}
+        self._king_squares = {"white": None, "black": None}
+        self._occupied = 0
+        self._piece_squares = {"white": 0, "black": 0}
+        self._sliding_squares = 0
+        self._changed_squares = _ALL_SQUARES
+
+        # Initialize pawns for both players, they are kept so reset can place them back on the chess board
+        self._start_pawns = tuple(
+            ChessPiece("pawn", "white" if square_index < 32 else "black") for square_index in _START_PAWN_SQUARES
+        )
+
+        for square_index, pawn in zip(_START_PAWN_SQUARES, self._start_pawns):
+            self._board[square_index] = pawn
 
-        # Initialize all locations of the chess board
-        for row in self._rows:
-            for column in self._columns:
-                square_location = column + row
-                self._chess_board[square_location] = None
+        # Initialize non-pawn pieces
+        for column_index in range(8):
+            non_pawn = self._home_pieces_order[column_index]
+            self._board[column_index] = _get_chess_piece(non_pawn, "white")
+            self._board[56 + column_index] = _get_chess_piece(non_pawn, "black")
 
-        # Initialize pawns for both players
-        for column in self._columns:
-            self._chess_board[column + "2"] = ChessPiece("pawn", "white")
-            self._chess_board[column + "7"] = ChessPiece("pawn", "black")
+        self._position_hash = _compute_position_hash(
+            self._board, self._player_color_turn, self._fairy_pieces_played, self._play_fairy_check
+        )
+        self._start_position_hash = self._position_hash
 
-        # Initialize non-pawn pieces
-        for index in range(len(self._columns)):
-            column = self._columns[index]
-            non_pawn = self._home_pieces_order[index]
-            self._chess_board[column + "1"] = ChessPiece(non_pawn, "white")
-            self._chess_board[column + "8"] = ChessPiece(non_pawn, "black")
+        if not self._headless:
+            print(self.get_chess_board_display())
 
-        print(self.get_chess_board_display())
+    def reset(self):
+        """
+        Sets the chess game back to the starting position without creating any chess piece, so a finished chess game
+        can be reused for a new game. The chess game's own pawns are placed back on their starting squares with their
+        first move, and the headless setting and callbacks are kept.
+        """
+        self._game_state = "UNFINISHED"
+        self._player_color_turn = "white"
+        self._board = [None] * 64
+        self._fairy_pieces_played = {"white": [], "black": []}
+        self._play_fairy_check = {
+            "black": {"queen": 1, "rook": 2, "bishop": 2, "knight": 2},
+            "white": {"queen": 1, "rook": 2, "bishop": 2, "knight": 2}
+        }
+        self._special_pieces_lost = {"white": 0, "black": 0}
+        self._move_stack = []
+
+        for square_index, pawn in zip(_START_PAWN_SQUARES, self._start_pawns):
+            pawn.set_max_moves(2)
+            self._board[square_index] = pawn
+
+        for column_index in range(8):
+            non_pawn = self._home_pieces_order[column_index]
+            self._board[column_index] = _get_chess_piece(non_pawn, "white")
+            self._board[56 + column_index] = _get_chess_piece(non_pawn, "black")
+
+        self._position_hash = self._start_position_hash
+        self._dirty_display_rows = 0xFF
+        self._changed_squares = _ALL_SQUARES
 
     def get_game_state(self):
         """
@@ -164,336 +605,1154 @@ class ChessVar:
         """
         return self._game_state
 
-    def make_move(self, current_space, destination_space, move_counter=0, original_space=None):
+    def get_position_hash(self):
         """
-        Recursively Moves the chess piece located at the current space to the destination space if legal, returning
-        a Boolean value depending on the success of the move. In each recursive call, current space is used to move the
-        chess piece towards the defined destination space. Move counter is used to track the number of moves and compare
-        to the max amount of moves a piece can make. Original space is used to access the original location and
-        chess piece object.
+        Returns the 64-bit hash of the current position. The hash covers the chess pieces and their squares, the
+        player turn, the pawns that still have their first move, the special pieces left to each player, and the fairy
+        pieces each player entered. It is updated with every move instead of being recomputed.
         """
+        return self._position_hash
 
-        # Base case if the specified spaces are invalid
-        if current_space not in self._chess_board or destination_space not in self._chess_board:
-            return False
+    def get_piece(self, square):
+        """
+        Returns the chess piece located at the given square name, or None if the square is empty or invalid. Chess
+        pieces other than pawns are shared by every chess game and must not be modified.
+        """
+        square_index = SQUARE_INDEXES.get(square)
 
-        # Saves the original starting space location
-        if original_space is None:
-            original_space = current_space
+        if square_index is None:
+            return None
 
-        original_space_piece = self._chess_board[original_space]
+        return self._board[square_index]
 
-        #  Base case if there is a piece to be moved at all
-        if original_space_piece is None:
+    def get_piece_at(self, square_index):
+        """
+        Returns the chess piece located at the square index, from 0 for a1 to 63 for h8, or None if it is empty. Chess
+        pieces other than pawns are shared by every chess game and must not be modified.
+        """
+        return self._board[square_index]
+
+    def get_board(self):
+        """
+        Returns a tuple of the chess piece on every square index, from a1 to h8, with None for empty squares. The chess
+        pieces are the chess game's own, so they must not be modified.
+        """
+        return tuple(self._board)
+
+    def get_player_turn(self):
+        """
+        Returns the player color of the current turn.
+        """
+        return self._player_color_turn
+
+    def get_fairy_pieces_played(self, player_color):
+        """
+        Returns a tuple of the fairy piece types the player color has entered, in the order they were entered.
+        """
+        return tuple(self._fairy_pieces_played[player_color])
+
+    def make_move(self, current_space, destination_space):
+        """
+        Moves the chess piece located at the current space to the destination space if legal, returning a Boolean
+        value depending on the success of the move. The square names are translated to board indexes, the move is
+        validated without changing the chess game, and only a legal move updates the chess board, the captured special
+        pieces, the game state, and the player turn.
+        """
+        current_index = SQUARE_INDEXES.get(current_space)
+        destination_index = SQUARE_INDEXES.get(destination_space)
+
+        # The specified spaces are invalid
+        if current_index is None or destination_index is None:
             return False
 
-        #  Base case if the game is over
-        if self._game_state != "UNFINISHED":
+        if not self._is_legal_move(current_index, destination_index):
+            return False
+
+        self._apply_move(current_index, destination_index)
+        self._move_stack.clear()
+        self._report_move(current_space, destination_space)
+        return True
+
+    def _report_move(self, first_name, second_name):
+        """
+        Prints the game state if a king was captured and the chess board unless the chess game is headless, then calls
+        the move callback and the game over callback if they are set.
+        """
+
+        if not self._headless:
+
+            # Captured destination piece is the King and game over
+            if self._game_state != "UNFINISHED":
+                print(self.get_game_state())
+
+            print(self.get_chess_board_display())
+
+        if self._move_callback is not None:
+            self._move_callback(self, (first_name, second_name))
+
+        if self._game_state != "UNFINISHED" and self._game_over_callback is not None:
+            self._game_over_callback(self, self._game_state)
+
+    def _is_legal_move(self, current_index, destination_index):
+        """
+        Returns whether the chess piece located at the current index can move to the destination index. The move is
+        looked up in the precomputed line and knight tables so each square on the path is checked in a single loop.
+        Nothing in the chess game is changed.
+        """
+        original_space_piece = self._board[current_index]
+
+        # There is no piece to be moved or the game is over
+        if original_space_piece is None or self._game_state != "UNFINISHED":
             return False
 
         original_piece_color = original_space_piece.get_player_color()
 
-        #  Base case if the piece to be moved is the same color as the player
+        # The piece to be moved is not the same color as the player
         if original_piece_color != self._player_color_turn:
             return False
 
-        move_set = original_space_piece.get_move_set()
-
-        current_column = current_space[0]
-        current_row = current_space[1]
+        destination_space_piece = self._board[destination_index]
 
-        current_column_index = self._columns.index(current_column)
-        current_row_index = self._rows.index(current_row)
+        # One of the player's piece is blocking the destination
+        if destination_space_piece is not None and destination_space_piece.get_player_color() == original_piece_color:
+            return False
 
-        destination_column = destination_space[0]
-        destination_row = destination_space[1]
+        original_piece_type = original_space_piece.get_piece_type()
 
-        current_space_piece = self._chess_board[current_space]
-        destination_space_piece = self._chess_board[destination_space]
+        # Knights jump over any piece in their path
+        if original_piece_type == "knight":
+            return destination_index in _KNIGHT_TARGETS[current_index]
 
-        column_diff = self._columns.index(destination_column) - self._columns.index(current_column)
-        row_diff = self._rows.index(destination_row) - self._rows.index(current_row)
+        line = _LINES[current_index * 64 + destination_index]
 
-        original_piece_type = original_space_piece.get_piece_type()
+        # The destination is not in a straight line or diagonal from the current space
+        if line is None:
+            return False
 
-        diagonal_slope = None
+        direction, distance = line
 
-        if row_diff != 0 and column_diff != 0:
-            diagonal_slope = row_diff / column_diff
+        # The destination space is out of the range of the moving piece
+        if distance > original_space_piece.get_max_moves():
+            return False
 
-        # Knight cannot move in a straight line or diagonally within its range
-        if original_piece_type == "knight" and move_counter == 0:
+        # Pawns only capture an immediate opponent piece diagonally forward and cannot capture vertically
+        if original_piece_type == "pawn" and destination_space_piece is not None:
 
-            if column_diff == 0 or row_diff == 0:
+            if distance != 1 or direction not in _PAWN_CAPTURE_DIRECTIONS[original_piece_color]:
                 return False
 
-            if column_diff % 2 != 0 and row_diff % 2 != 0:
+        elif not original_space_piece.get_move_mask() >> direction & 1:
+            return False
+
+        # There is a piece obstructing the path
+        board = self._board
+
+        for path_index in _RAYS[current_index][direction][:distance - 1]:
+
+            if board[path_index] is not None:
                 return False
 
-        # Special cases for when there is a chess piece at the destination space
+        return True
+
+    def _apply_move(self, current_index, destination_index):
+        """
+        Moves the chess piece located at the current index to the destination index after the move was validated.
+        Updates the captured special pieces, the game state when a king is captured, the pawn's max moves, and the
+        player turn. Returns the undo entry holding the numbered move, the captured piece, the moving piece's previous
+        max moves, and the previous game state.
+        """
+        original_space_piece = self._board[current_index]
+        destination_space_piece = self._board[destination_index]
+        undo_entry = (
+            (current_index << 6) | destination_index,
+            destination_space_piece,
+            original_space_piece.get_max_moves(),
+            self._game_state,
+            self._position_hash
+        )
+        position_hash = self._position_hash ^ _ZOBRIST_BLACK_TURN ^ _get_piece_hash(original_space_piece, current_index)
+
+        # If there is a chess piece at the destination space
         if destination_space_piece is not None:
 
+            destination_piece_type = destination_space_piece.get_piece_type()
+
+            # Captured destination piece is the King and game over
+            if destination_piece_type == "king":
+                self._game_state = original_space_piece.get_player_color().upper() + "_WON"
+
             destination_piece_color = destination_space_piece.get_player_color()
+            pieces_to_check = self._play_fairy_check[destination_piece_color]
+            position_hash ^= _get_piece_hash(destination_space_piece, destination_index)
+
+            # Decrements the special pawn count for fairy pieces
+            if destination_piece_type in pieces_to_check:
+                special_piece_keys = _ZOBRIST_SPECIAL_PIECES[(destination_piece_color, destination_piece_type)]
+                position_hash ^= special_piece_keys[pieces_to_check[destination_piece_type]]
+                pieces_to_check[destination_piece_type] -= 1
+                position_hash ^= special_piece_keys[pieces_to_check[destination_piece_type]]
+                self._special_pieces_lost[destination_piece_color] += 1
+
+        # Pawns only move one space after first move
+        if original_space_piece.get_piece_type() == "pawn":
+            original_space_piece.set_max_moves(1)
+
+        self._board[destination_index] = original_space_piece
+        self._board[current_index] = None
+        self._changed_squares |= (1 << current_index) | (1 << destination_index)
+        self._dirty_display_rows |= (1 << (current_index >> 3)) | (1 << (destination_index >> 3))
+        self._position_hash = position_hash ^ _get_piece_hash(original_space_piece, destination_index)
+
+        # Changes the whose turn it is
+        if self._player_color_turn == "white":
+            self._player_color_turn = "black"
+        else:
+            self._player_color_turn = "white"
+
+        return undo_entry
 
-            #  Base case if one of the player's piece is blocking the destination
-            if destination_piece_color == self._player_color_turn:
-                return False
+    def enter_fairy_piece(self, piece_type, enter_square):
+        """
+        Initializes the fairy piece in the specified location if legal, returning Boolean value depending on
+        successful initialization. The piece type is "F" or "H" for a white falcon or hunter and "f" or "h" for a black
+        one, while the enter square must be an empty square on one of the player's two home ranks.
+        """
+        fairy_entry = self._get_fairy_entry(piece_type, enter_square)
+
+        if fairy_entry is None:
+            return False
+
+        self._apply_fairy_piece(*fairy_entry)
+        self._move_stack.clear()
+        self._report_move(piece_type, enter_square)
+        return True
+
+    def _get_fairy_entry(self, piece_type, enter_square):
+        """
+        Returns the tuple of fairy piece type and enter index of the fairy piece letter and enter square name if the
+        player of the current turn can enter it, or None if the entry is not legal. Nothing in the chess game is
+        changed. Used by enter_fairy_piece and push_fairy_piece to validate the entry.
+        """
 
-            # Allows pawn to move diagonally if there is an immediate opponent piece
-            if original_piece_type == "pawn" and move_counter == 0:
+        # Checks if the piece_type is a single letter naming a fairy piece
+        if piece_type not in ("F", "H", "f", "h"):
+            return None
 
-                if column_diff != 0 and row_diff != 0:
+        # piece type matches the player color of the current turn
+        if piece_type.isupper() != (self._player_color_turn == "white"):
+            return None
 
-                    if 1 % column_diff == 0 and 1 % row_diff == 0:
+        enter_index = SQUARE_INDEXES.get(enter_square)
 
-                        if original_space_piece.get_player_color() == "white":
-                            original_space_piece.get_move_set().append("diagonal_up")
+        # Checks if the enter square is valid
+        if enter_index is None:
+            return None
 
-                        else:
-                            original_space_piece.get_move_set().append("diagonal_down")
+        fairy_piece_type = _FAIRY_PIECE_LETTERS[piece_type.lower()]
 
-        # Base case if there is a piece obstructing the path unless the moving piece is a knight
-        if current_space_piece is not None and move_counter > 0 and current_space != destination_space:
+        if not self._can_enter_fairy_piece(fairy_piece_type, enter_index):
+            return None
 
-            if original_piece_type != "knight":
-                return False
+        return fairy_piece_type, enter_index
 
-        # Base case if the destination space is out of the range of the moving piece
-        if move_counter > original_space_piece.get_max_moves():
+    def _can_enter_fairy_piece(self, fairy_piece_type, enter_index):
+        """
+        Returns whether the player of the current turn can enter the fairy piece type at the enter index. Nothing in
+        the chess game is changed.
+        """
+
+        # Checks if the game is unfinished
+        if self._game_state != "UNFINISHED":
             return False
 
-        # Base case if the move is able to be made
-        if current_space == destination_space:
+        # Checks if the fairy piece is entering on an empty space of the player's home ranks
+        if self._board[enter_index] is not None or enter_index not in _HOME_RANK_SQUARES[self._player_color_turn]:
+            return False
 
-            # If there is a chess piece at the destination space
-            if destination_space_piece is not None:
+        # Checks if the fairy piece is already in play
+        if fairy_piece_type in self._fairy_pieces_played[self._player_color_turn]:
+            return False
 
-                destination_piece_type = destination_space_piece.get_piece_type()
+        return self._can_enter_next_fairy_piece()
 
-                # Captured destination piece is the King and game over
-                if destination_piece_type == "king":
-                    self._game_state = original_piece_color.upper() + "_WON"
-                    print(self.get_game_state())
+    def _can_enter_next_fairy_piece(self):
+        """
+        Returns whether the player of the current turn lost enough special pieces to enter their next fairy piece.
+        The first fairy piece can be entered after losing a special piece and the second after losing another one.
+        """
+        fairy_pieces_played = len(self._fairy_pieces_played[self._player_color_turn])
 
-                # Pawn cannot capture a piece vertically
-                if original_piece_type == "pawn":
+        if fairy_pieces_played == len(_FAIRY_PIECE_TYPES):
+            return False
 
-                    if "diagonal_down" not in move_set and "diagonal_up" not in move_set:
-                        return False
+        return self._special_pieces_lost[self._player_color_turn] > fairy_pieces_played
 
-                pieces_to_check = self._play_fairy_check[destination_space_piece.get_player_color()]
+    def get_special_pieces_lost(self, player_color):
+        """
+        Returns the number of special pieces, the queen, rooks, bishops, and knights, the player color has lost. The
+        count is kept up to date by every move, so checking whether a fairy piece can be entered needs no counting.
+        """
+        return self._special_pieces_lost[player_color]
 
-                # Decrements the special pawn count for fairy pieces
-                if destination_piece_type in pieces_to_check:
-                    pieces_to_check[destination_piece_type] -= 1
+    def get_fairy_drops(self):
+        """
+        Returns a list of every fairy piece entry the player of the current turn can make, as tuples of the piece type
+        letter and the enter square accepted by enter_fairy_piece, such as ("F", "c1"). The chess game is never
+        changed.
+        """
+        fairy_drops = []
 
-            # Special cases after a pawn moves
-            if original_piece_type == "pawn":
+        for fairy_move in self._generate_fairy_moves():
+            fairy_drops.append(self._get_move_names(fairy_move))
 
-                # Pawns only move one space after first move
-                original_space_piece.set_max_moves(1)
+        return fairy_drops
 
-                # Remove the pawn's special diagonal move after capturing opponent pawn
-                if "diagonal_up" in move_set:
-                    original_space_piece.get_move_set().remove("diagonal_up")
+    def _apply_fairy_piece(self, fairy_piece_type, enter_index):
+        """
+        Enters the fairy piece type for the player of the current turn at the enter index after the entry was
+        validated, then changes the player turn. Returns the undo entry in the same form as _apply_move.
+        """
+        fairy_move = FAIRY_MOVE_BASE + (_FAIRY_PIECE_TYPES.index(fairy_piece_type) << 6) + enter_index
+        undo_entry = (fairy_move, None, 0, self._game_state, self._position_hash)
+        fairy_piece = _get_chess_piece(fairy_piece_type, self._player_color_turn)
+
+        self._board[enter_index] = fairy_piece
+        self._changed_squares |= 1 << enter_index
+        self._dirty_display_rows |= 1 << (enter_index >> 3)
+        self._fairy_pieces_played[self._player_color_turn].append(fairy_piece_type)
+        self._position_hash ^= (
+            _ZOBRIST_BLACK_TURN
+            ^ _get_piece_hash(fairy_piece, enter_index)
+            ^ _ZOBRIST_FAIRY_PLAYED[(self._player_color_turn, fairy_piece_type)]
+        )
+
+        # Changes the whose turn it is
+        if self._player_color_turn == "white":
+            self._player_color_turn = "black"
+        else:
+            self._player_color_turn = "white"
+
+        return undo_entry
+
+    def push_move(self, current_space, destination_space):
+        """
+        Makes the move like make_move without printing the chess board and records an undo entry so pop_move can
+        restore the chess game exactly. Returns a Boolean value depending on the success of the move. Used to explore
+        variations without copying the chess game.
+        """
+        current_index = SQUARE_INDEXES.get(current_space)
+        destination_index = SQUARE_INDEXES.get(destination_space)
 
-                if "diagonal_down" in move_set:
-                    original_space_piece.get_move_set().remove("diagonal_down")
+        if current_index is None or destination_index is None:
+            return False
 
-            self._chess_board[destination_space] = original_space_piece
-            self._chess_board[original_space] = None
+        if not self._is_legal_move(current_index, destination_index):
+            return False
 
-            # Changes the whose turn it is
-            if self._player_color_turn == "white":
-                self._player_color_turn = "black"
-            else:
-                self._player_color_turn = "white"
+        self._move_stack.append(self._apply_move(current_index, destination_index))
+        return True
 
-            print(self.get_chess_board_display())
-            return True
+    def push_fairy_piece(self, piece_type, enter_square):
+        """
+        Enters the fairy piece like enter_fairy_piece without printing the chess board and records an undo entry so
+        pop_move can restore the chess game exactly. Returns a Boolean value depending on the success of the entry.
+        """
+        fairy_entry = self._get_fairy_entry(piece_type, enter_square)
+
+        if fairy_entry is None:
+            return False
+
+        self._move_stack.append(self._apply_fairy_piece(*fairy_entry))
+        return True
+
+    def push_numbered_move(self, move):
+        """
+        Makes a legal numbered move returned by generate_numbered_moves like push_move, so pop_move can undo it. The
+        move is not validated again.
+        """
+        self._push(move)
+
+    def get_move_stack_depth(self):
+        """
+        Returns the number of moves and fairy piece entries pop_move can undo.
+        """
+        return len(self._move_stack)
+
+    def pop_move(self):
+        """
+        Undoes the most recent move or fairy piece entry made by push_move, push_fairy_piece, or push_numbered_move,
+        returning a Boolean value depending on whether there was one to undo. Moves made by make_move or
+        enter_fairy_piece are permanent and cannot be undone.
+        """
+
+        if not self._move_stack:
+            return False
 
-        # Move diagonally
-        if "diagonal_up" in move_set or "diagonal" in move_set:
+        self._pop()
+        return True
 
-            # Move upper-right
-            if row_diff > 0 and column_diff > 0 and diagonal_slope == 1:
-                current_space = self._columns[current_column_index + 1] + self._rows[current_row_index + 1]
-                return self.make_move(current_space, destination_space, move_counter + 1, original_space)
+    def _push(self, move):
+        """
+        Makes the legal numbered move, such as one returned by _generate_moves, and records its undo entry.
+        """
 
-            # Move diagonally upper-left
-            if row_diff > 0 > column_diff and diagonal_slope == -1:
-                current_space = self._columns[current_column_index - 1] + self._rows[current_row_index + 1]
-                return self.make_move(current_space, destination_space, move_counter + 1, original_space)
+        if move < FAIRY_MOVE_BASE:
+            self._move_stack.append(self._apply_move(move >> 6, move & 63))
 
-        if "diagonal_down" in move_set or "diagonal" in move_set:
+        else:
+            fairy_piece_type = _FAIRY_PIECE_TYPES[(move - FAIRY_MOVE_BASE) >> 6]
+            self._move_stack.append(self._apply_fairy_piece(fairy_piece_type, move & 63))
 
-            # Move diagonally lower-right
-            if row_diff < 0 < column_diff and diagonal_slope == -1:
-                current_space = self._columns[current_column_index + 1] + self._rows[current_row_index - 1]
-                return self.make_move(current_space, destination_space, move_counter + 1, original_space)
+    def _pop(self):
+        """
+        Restores the chess game from the most recent undo entry. The player turn is changed back first so that it
+        names the player who made the move being undone.
+        """
+        move, captured_piece, max_moves, game_state, position_hash = self._move_stack.pop()
+        self._position_hash = position_hash
 
-            # Move diagonally lower-left
-            if row_diff < 0 and column_diff < 0 and diagonal_slope == 1:
-                current_space = self._columns[current_column_index - 1] + self._rows[current_row_index - 1]
-                return self.make_move(current_space, destination_space, move_counter + 1, original_space)
+        if self._player_color_turn == "white":
+            self._player_color_turn = "black"
+        else:
+            self._player_color_turn = "white"
 
-        # Move horizontally
-        if "horizontal" in move_set and row_diff == 0 or original_piece_type == "knight":
+        destination_index = move & 63
+        self._dirty_display_rows |= 1 << (destination_index >> 3)
+        self._changed_squares |= 1 << destination_index
 
-            # Move right
-            if column_diff >= 1:
-                current_space = self._columns[current_column_index + 1] + current_row
-                return self.make_move(current_space, destination_space, move_counter + 1, original_space)
+        # Removes the entered fairy piece and returns it to the player's reserve
+        if move >= FAIRY_MOVE_BASE:
+            self._board[destination_index] = None
+            self._fairy_pieces_played[self._player_color_turn].pop()
+            return
 
-            # Move left
-            if column_diff <= -1:
-                current_space = self._columns[current_column_index - 1] + current_row
-                return self.make_move(current_space, destination_space, move_counter + 1, original_space)
+        current_index = move >> 6
+        self._dirty_display_rows |= 1 << (current_index >> 3)
+        self._changed_squares |= 1 << current_index
+        moved_piece = self._board[destination_index]
 
-        # Move up
-        if "vertical_up" in move_set and column_diff == 0 or original_piece_type == "knight":
+        # Gives a pawn back its first move
+        if moved_piece.get_piece_type() == "pawn":
+            moved_piece.set_max_moves(max_moves)
 
-            if row_diff >= 1:
-                current_space = self._columns[current_column_index] + self._rows[current_row_index + 1]
-                return self.make_move(current_space, destination_space, move_counter + 1, original_space)
+        self._board[current_index] = moved_piece
+        self._board[destination_index] = captured_piece
+        self._game_state = game_state
 
-        # Move down
-        if "vertical_down" in move_set and column_diff == 0 or original_piece_type == "knight":
+        # Restores the special pawn count of the captured piece
+        if captured_piece is not None:
 
-            if row_diff <= -1:
-                current_space = self._columns[current_column_index] + self._rows[current_row_index - 1]
-                return self.make_move(current_space, destination_space, move_counter + 1, original_space)
+            captured_piece_color = captured_piece.get_player_color()
+            pieces_to_check = self._play_fairy_check[captured_piece_color]
+            captured_piece_type = captured_piece.get_piece_type()
 
-        # The chess piece is unable to move to the destination
-        return False
+            if captured_piece_type in pieces_to_check:
+                pieces_to_check[captured_piece_type] += 1
+                self._special_pieces_lost[captured_piece_color] -= 1
 
-    def enter_fairy_piece(self, piece_type, enter_square):
+    def is_attacked(self, square, player_color):
         """
-        Initializes the fairy piece in the specified location if legal, returning Boolean value depending on
-        successful initialization. The piece type is used to deduce the fairy piece's color and type while the enter
-        square is used to determine the starting location in either player's two home ranks.
+        Returns whether any chess piece of the player color could capture on the square name if an opposing piece
+        stood there, or False if the square name is invalid. Squares holding the player's own pieces count as attacked
+        when they are defended.
         """
-        home_rank_rows = ("1", "2", "7", "8")
+        square_index = SQUARE_INDEXES.get(square)
 
-        # Checks if the piece_type length is valid
-        if len(piece_type) > 1 or piece_type == "":
+        if square_index is None:
             return False
 
-        # Checks if the game is unfinished
-        if self._game_state != "UNFINISHED":
-            return False
+        self._update_attack_maps()
+        return self._attacked_squares[player_color] >> square_index & 1 == 1
 
-        # Checks if the fairy piece is entering on a valid, empty space
-        if enter_square not in self._chess_board or self._chess_board[enter_square] is not None:
-            return False
+    def get_attackers(self, square, player_color):
+        """
+        Returns the list of square names of the chess pieces of the player color attacking the square name.
+        """
+        square_index = SQUARE_INDEXES.get(square)
 
-        # The fairy piece is not entering a home rank space
-        if enter_square[1] not in home_rank_rows:
-            return False
+        if square_index is None:
+            return []
 
-        # piece type matches the player color of the current turn
-        if piece_type.isupper() and self._player_color_turn == "black":
-            return False
+        self._update_attack_maps()
+        attackers = []
+        piece_squares = self._piece_squares[player_color]
+
+        for attacker_index in range(64):
+
+            if piece_squares >> attacker_index & 1 and self._attacks[attacker_index] >> square_index & 1:
+                attackers.append(SQUARE_NAMES[attacker_index])
+
+        return attackers
+
+    def king_in_danger(self, player_color):
+        """
+        Returns whether the opponent of the player color can capture the player's king with their next move, or False
+        if the player's king was already captured.
+        """
+        self._update_attack_maps()
+        king_index = self._king_squares[player_color]
 
-        if piece_type.islower() and self._player_color_turn == "white":
+        if king_index is None:
             return False
 
+        opponent_color = "black" if player_color == "white" else "white"
+        return self._attacked_squares[opponent_color] >> king_index & 1 == 1
+
+    def _update_attack_maps(self):
+        """
+        Brings the occupancy bitmask, king squares, and attack maps up to date with the squares changed by the moves
+        made since they were last updated. Only the chess pieces on the changed squares and the sliding chess pieces
+        whose rays reached a changed square get their attacks computed again, since no other chess piece's attacks can
+        differ, and the squares attacked by each player are the union of their chess pieces' attacks. Moves only
+        record the squares they change, so moves made and undone while searching cost nothing until the attack maps
+        are queried.
+        """
+        changed_squares = self._changed_squares
+
+        if not changed_squares:
+            return
+
+        self._changed_squares = 0
+        board = self._board
+        attacks = self._attacks
+        piece_squares = self._piece_squares
+        unchanged_mask = ~changed_squares
+
+        # Sliding chess pieces off the changed squares whose rays reached one may now stop earlier or reach further
+        remaining_squares = self._sliding_squares & unchanged_mask
+        update_squares = 0
+
+        while remaining_squares:
+            square_bit = remaining_squares & -remaining_squares
+            remaining_squares ^= square_bit
+
+            if attacks[square_bit.bit_length() - 1] & changed_squares:
+                update_squares |= square_bit
+
+        # A king can only have left or been captured on a changed square
+        for player_color in ("white", "black"):
+
+            king_index = self._king_squares[player_color]
+
+            if king_index is not None and changed_squares >> king_index & 1:
+                self._king_squares[player_color] = None
+
+        self._occupied &= unchanged_mask
+        self._sliding_squares &= unchanged_mask
+        piece_squares["white"] &= unchanged_mask
+        piece_squares["black"] &= unchanged_mask
+        remaining_squares = changed_squares
+
+        # The chess pieces now on the changed squares are recorded and get their attacks computed
+        while remaining_squares:
+
+            square_bit = remaining_squares & -remaining_squares
+            square_index = square_bit.bit_length() - 1
+            remaining_squares ^= square_bit
+            chess_piece = board[square_index]
+            attacks[square_index] = 0
+
+            if chess_piece is None:
+                continue
+
+            piece_type = chess_piece.get_piece_type()
+            player_color = chess_piece.get_player_color()
+            self._occupied |= square_bit
+            piece_squares[player_color] |= square_bit
+            update_squares |= square_bit
+
+            if piece_type in _SLIDING_PIECE_TYPES:
+                self._sliding_squares |= square_bit
+
+            elif piece_type == "king":
+                self._king_squares[player_color] = square_index
+
+        while update_squares:
+            square_bit = update_squares & -update_squares
+            square_index = square_bit.bit_length() - 1
+            update_squares ^= square_bit
+            attacks[square_index] = self._get_attacks(board[square_index], square_index)
+
+        # The squares attacked by each player are the union of their chess pieces' attacks
+        for player_color in ("white", "black"):
+
+            attacked_squares = 0
+            remaining_squares = piece_squares[player_color]
+
+            while remaining_squares:
+                square_bit = remaining_squares & -remaining_squares
+                remaining_squares ^= square_bit
+                attacked_squares |= attacks[square_bit.bit_length() - 1]
+
+            self._attacked_squares[player_color] = attacked_squares
+
+    def _get_attacks(self, chess_piece, square_index):
+        """
+        Returns the bitmask of the squares the chess piece standing on the square index attacks. Each ray is cut after
+        the nearest occupied square found in the occupancy bitmask.
+        """
+        occupied = self._occupied
+        piece_rays = _ATTACK_MASKS[(chess_piece.get_piece_type(), chess_piece.get_player_color())][square_index]
+        attacks = 0
+
+        for ray_mask, increasing in piece_rays:
+
+            blockers = ray_mask & occupied
+
+            if not blockers or increasing is None:
+                attacks |= ray_mask
+
+            # The nearest blocker is the lowest set bit on increasing rays and the highest on decreasing rays
+            elif increasing:
+                attacks |= ray_mask & (((blockers & -blockers) << 1) - 1)
+
+            else:
+                attacks |= ray_mask & -(1 << (blockers.bit_length() - 1))
+
+        return attacks
+
+    def generate_moves(self):
+        """
+        Returns a list of every legal move for the player of the current turn. Board moves are tuples of the current
+        and destination square names accepted by make_move, and fairy piece entries are tuples of the piece type letter
+        and the enter square accepted by enter_fairy_piece.
+        """
+        legal_moves = []
+
+        for move in self._generate_moves():
+            legal_moves.append(self._get_move_names(move))
+
+        return legal_moves
+
+    def generate_numbered_moves(self):
+        """
+        Returns a list of every legal move for the player of the current turn as move numbers, which are cheaper to
+        make than names. A board move is numbered as its current square index times 64 plus its destination square
+        index, and a fairy piece entry as FAIRY_MOVE_BASE plus 64 times the fairy piece's number plus the enter square
+        index. Used by searches together with push_numbered_move and pop_move.
+        """
+        return self._generate_moves()
+
+    def get_move_names(self, move):
+        """
+        Returns the tuple of names of a numbered move for the player of the current turn, as accepted by make_move or
+        enter_fairy_piece.
+        """
+        return self._get_move_names(move)
+
+    def validate_moves(self, move_requests):
+        """
+        Returns a list of Boolean values telling whether each move request is legal for the player of the current turn.
+        A move request is either a tuple of the current and destination square names as given to make_move or a tuple
+        of the fairy piece letter and enter square as given to enter_fairy_piece. The legal moves are generated once
+        for the whole batch and the chess game is never changed.
+        """
+        legal_moves = set(self._generate_moves())
+        fairy_piece_letters = ("F", "H") if self._player_color_turn == "white" else ("f", "h")
+        validated_moves = []
+
+        for first_name, second_name in move_requests:
+
+            second_index = SQUARE_INDEXES.get(second_name)
+            first_index = SQUARE_INDEXES.get(first_name)
+
+            if second_index is None:
+                validated_moves.append(False)
+
+            elif first_index is not None:
+                validated_moves.append((first_index << 6 | second_index) in legal_moves)
+
+            elif first_name in fairy_piece_letters:
+                fairy_move = FAIRY_MOVE_BASE + (fairy_piece_letters.index(first_name) << 6) + second_index
+                validated_moves.append(fairy_move in legal_moves)
+
+            else:
+                validated_moves.append(False)
+
+        return validated_moves
+
+    def _get_move_names(self, move):
+        """
+        Returns the tuple of names for a numbered move as used by make_move or enter_fairy_piece.
+        """
+
+        if move < FAIRY_MOVE_BASE:
+            return SQUARE_NAMES[move >> 6], SQUARE_NAMES[move & 63]
+
+        fairy_piece_letter = _FAIRY_PIECE_TYPES[(move - FAIRY_MOVE_BASE) >> 6][0]
+
+        if self._player_color_turn == "white":
+            fairy_piece_letter = fairy_piece_letter.upper()
+
+        return fairy_piece_letter, SQUARE_NAMES[move & 63]
+
+    def _generate_moves(self):
+        """
+        Returns a list of every legal numbered move for the player of the current turn. Each chess piece walks the rays
+        of its attack table until a piece blocks it, and pawns walk their forward ray separately since they cannot
+        capture on it.
+        """
+        legal_moves = []
+
+        if self._game_state != "UNFINISHED":
+            return legal_moves
+
+        board = self._board
+        player_color = self._player_color_turn
+
+        for square_index in range(64):
+
+            chess_piece = board[square_index]
+
+            if chess_piece is None or chess_piece.get_player_color() != player_color:
+                continue
+
+            move_base = square_index << 6
+            piece_type = chess_piece.get_piece_type()
+
+            # Pawns move forward only onto empty spaces
+            if piece_type == "pawn":
+
+                for target_index in PAWN_PUSH_RAYS[player_color][square_index][:chess_piece.get_max_moves()]:
+
+                    if board[target_index] is not None:
+                        break
+
+                    legal_moves.append(move_base | target_index)
+
+            for ray in ATTACK_TABLES[(piece_type, player_color)][square_index]:
+
+                for target_index in ray:
+
+                    target_piece = board[target_index]
+
+                    if target_piece is None:
+
+                        # Pawns only move diagonally when capturing
+                        if piece_type != "pawn":
+                            legal_moves.append(move_base | target_index)
+
+                        continue
+
+                    if target_piece.get_player_color() != player_color:
+                        legal_moves.append(move_base | target_index)
+
+                    break
+
+        legal_moves.extend(self._generate_fairy_moves())
+        return legal_moves
+
+    def _generate_fairy_moves(self):
+        """
+        Returns a list of every numbered fairy piece entry the player of the current turn can make.
+        """
+        fairy_moves = []
+
+        if self._game_state != "UNFINISHED" or not self._can_enter_next_fairy_piece():
+            return fairy_moves
+
+        board = self._board
         fairy_pieces_played = self._fairy_pieces_played[self._player_color_turn]
 
-        # Manipulate piece type from user input
-        fairy_piece_type = piece_type.lower()
+        for fairy_index in range(len(_FAIRY_PIECE_TYPES)):
 
-        if fairy_piece_type == "f":
-            fairy_piece_type = "falcon"
+            if _FAIRY_PIECE_TYPES[fairy_index] in fairy_pieces_played:
+                continue
 
-        if fairy_piece_type == "h":
-            fairy_piece_type = "hunter"
+            move_base = FAIRY_MOVE_BASE + (fairy_index << 6)
 
-        # Checks if the fairy piece is played
-        if fairy_piece_type not in fairy_pieces_played:
+            for enter_index in _HOME_RANK_SQUARES[self._player_color_turn]:
 
-            total_pieces = 0
-            first_fairy_piece_check = 6
-            second_fairy_piece_check = 5
-            pieces_to_check = self._play_fairy_check[self._player_color_turn]
-            fairy_piece = None
+                if board[enter_index] is None:
+                    fairy_moves.append(move_base | enter_index)
 
-            # Counts the number of special pieces of the player's turn
-            for piece_type in pieces_to_check:
-                total_pieces += pieces_to_check[piece_type]
+        return fairy_moves
 
-            # The first fairy piece can be played after losing a special piece
-            if len(fairy_pieces_played) == 0 and total_pieces <= first_fairy_piece_check:
-                fairy_piece = ChessPiece(fairy_piece_type, self._player_color_turn)
+    def get_fen(self):
+        """
+        Returns the position as a string of five fields separated by spaces, similar to the FEN of standard chess. The
+        fields are the chess board from row 8 to row 1 with upper case letters for white pieces and digits for empty
+        squares, the player turn as "w" or "b", the fairy pieces each player has not entered yet such as "FHfh" or "-",
+        the queens, rooks, bishops, and knights left for the fairy piece check of white and black such as "1222/1222",
+        and the squares of the pawns that still have their first move such as "a2b2" or "-".
+        """
+        board_rows = []
+        first_move_pawns = []
 
-            # The second fairy piece can be played after losing another special piece
-            if len(fairy_pieces_played) == 1 and total_pieces <= second_fairy_piece_check:
-                fairy_piece = ChessPiece(fairy_piece_type, self._player_color_turn)
+        for row_index in range(7, -1, -1):
 
-            # Enter the fairy piece on the given space
-            if fairy_piece is not None:
+            row_letters = ""
+            empty_squares = 0
 
-                # The fairy piece starts on the white home ranks
-                if enter_square[1] == "1" or enter_square[1] == "2" and self._player_color_turn == "white":
-                    self._chess_board[enter_square] = fairy_piece
+            for square_index in range(row_index * 8, row_index * 8 + 8):
 
-                # The fairy piece starts on the black home ranks
-                if enter_square[1] == "8" or enter_square[1] == "7" and self._player_color_turn == "black":
-                    self._chess_board[enter_square] = fairy_piece
+                chess_piece = self._board[square_index]
 
-                fairy_pieces_played.append(fairy_piece_type)
+                if chess_piece is None:
+                    empty_squares += 1
+                    continue
 
-                # Changes the whose turn it is
-                if self._player_color_turn == "white":
-                    self._player_color_turn = "black"
-                else:
-                    self._player_color_turn = "white"
+                if empty_squares:
+                    row_letters += str(empty_squares)
+                    empty_squares = 0
 
-                print(self.get_chess_board_display())
+                piece_letter = PIECE_LETTERS[chess_piece.get_piece_type()]
 
-                return True
+                if chess_piece.get_player_color() == "white":
+                    piece_letter = piece_letter.upper()
 
-            # The player must lose more special pieces to enter a fairy piece
-            return False
+                row_letters += piece_letter
 
-        # The fairy piece is already in play
-        return False
+            if empty_squares:
+                row_letters += str(empty_squares)
 
-    def get_chess_board_display(self):
+            board_rows.append(row_letters)
+
+        for square_index in range(64):
+
+            chess_piece = self._board[square_index]
+
+            if chess_piece is not None and chess_piece.get_piece_type() == "pawn" and chess_piece.get_max_moves() == 2:
+                first_move_pawns.append(SQUARE_NAMES[square_index])
+
+        fairy_reserve = ""
+
+        for player_color in ("white", "black"):
+
+            for fairy_piece_type in _FAIRY_PIECE_TYPES:
+
+                if fairy_piece_type not in self._fairy_pieces_played[player_color]:
+                    fairy_reserve += fairy_piece_type[0].upper() if player_color == "white" else fairy_piece_type[0]
+
+        special_pieces = []
+
+        for player_color in ("white", "black"):
+            pieces_to_check = self._play_fairy_check[player_color]
+            special_pieces.append("".join(str(pieces_to_check[piece_type]) for piece_type in _SPECIAL_PIECE_TYPES))
+
+        return " ".join((
+            "/".join(board_rows),
+            self._player_color_turn[0],
+            fairy_reserve or "-",
+            "/".join(special_pieces),
+            "".join(first_move_pawns) or "-"
+        ))
+
+    def set_fen(self, fen):
         """
-        Creates and returns the string representation of the current chess board.
+        Sets the chess game to the position string returned by get_fen. The game state is won by the player whose
+        king is still on the chess board if the other king was captured. Raises ValueError if the string is not a valid
+        position string, leaving the chess game unchanged.
         """
-        chess_board = []
+        fields = fen.split()
 
-        for row in self._rows:
+        if len(fields) != 5:
+            raise ValueError("position string must have 5 fields: " + repr(fen))
 
-            temporary_line = []
+        board_field, turn_field, reserve_field, special_field, pawn_field = fields
+        board = [None] * 64
+        board_rows = board_field.split("/")
 
-            for column in self._columns:
-                square_location = column + row
-                temporary_line.append(square_location)
+        if len(board_rows) != 8:
+            raise ValueError("chess board field must have 8 rows: " + repr(board_field))
 
-            chess_board.append(temporary_line)
+        letter_types = {letter: piece_type for piece_type, letter in PIECE_LETTERS.items()}
 
-        chess_board_string = "   a   b   c   d   e   f   g   h\n"
-        empty_square = "[  ]"
+        for row_offset in range(8):
+
+            square_index = (7 - row_offset) * 8
+            row_end = square_index + 8
+
+            for letter in board_rows[row_offset]:
+
+                if letter in "12345678":
+                    square_index += int(letter)
+                    continue
+
+                if letter.lower() not in letter_types or square_index >= row_end:
+                    raise ValueError("invalid chess board row: " + repr(board_rows[row_offset]))
+
+                player_color = "white" if letter.isupper() else "black"
+                board[square_index] = _get_chess_piece(letter_types[letter.lower()], player_color)
+                square_index += 1
+
+            if square_index != row_end:
+                raise ValueError("chess board row must have 8 squares: " + repr(board_rows[row_offset]))
+
+        if turn_field not in ("w", "b"):
+            raise ValueError("player turn must be w or b: " + repr(turn_field))
+
+        fairy_pieces_played = {"white": [], "black": []}
+
+        for player_color in ("white", "black"):
+
+            for fairy_piece_type in _FAIRY_PIECE_TYPES:
+
+                fairy_piece_letter = fairy_piece_type[0].upper() if player_color == "white" else fairy_piece_type[0]
+
+                if fairy_piece_letter not in reserve_field:
+                    fairy_pieces_played[player_color].append(fairy_piece_type)
+
+        if reserve_field != "-" and any(letter not in "FHfh" for letter in reserve_field):
+            raise ValueError("invalid fairy piece reserve: " + repr(reserve_field))
+
+        play_fairy_check = {}
+        special_counts = special_field.split("/")
+
+        if len(special_counts) != 2 or any(len(counts) != 4 or not counts.isdigit() for counts in special_counts):
+            raise ValueError("invalid special piece counts: " + repr(special_field))
+
+        for player_color, counts in zip(("white", "black"), special_counts):
+
+            play_fairy_check[player_color] = {}
+
+            for piece_type, count in zip(_SPECIAL_PIECE_TYPES, counts):
+
+                if int(count) > (1 if piece_type == "queen" else 2):
+                    raise ValueError("invalid special piece counts: " + repr(special_field))
+
+                play_fairy_check[player_color][piece_type] = int(count)
+
+        first_move_squares = set()
+
+        if pawn_field != "-":
+
+            for name_index in range(0, len(pawn_field), 2):
+
+                square_index = SQUARE_INDEXES.get(pawn_field[name_index:name_index + 2])
+
+                if square_index is None or board[square_index] is None:
+                    raise ValueError("invalid first move pawn squares: " + repr(pawn_field))
+
+                if board[square_index].get_piece_type() != "pawn":
+                    raise ValueError("invalid first move pawn squares: " + repr(pawn_field))
+
+                first_move_squares.add(square_index)
+
+        self._set_position(
+            board, "white" if turn_field == "w" else "black", fairy_pieces_played, play_fairy_check, first_move_squares
+        )
+
+    def get_position_bytes(self):
+        """
+        Returns the position as 40 bytes. The first 8 bytes are the bitboard of occupied squares, the next 18 bytes
+        hold 4 bits for each occupied square in index order with the piece type number and a bit set for black, the
+        next 8 bytes are the bitboard of pawns that still have their first move, then one byte holds the player turn
+        and the entered fairy pieces and two bytes hold the special pieces left for the fairy piece check. The last 3
+        bytes are zero.
+        """
+        occupied = 0
+        first_move_pawns = 0
+        piece_codes = bytearray(18)
+        piece_count = 0
+
+        for square_index in range(64):
+
+            chess_piece = self._board[square_index]
+
+            if chess_piece is None:
+                continue
+
+            piece_type = chess_piece.get_piece_type()
+            piece_code = PIECE_TYPES.index(piece_type)
+
+            if chess_piece.get_player_color() == "black":
+                piece_code |= 8
+
+            if piece_count >= 36:
+                raise ValueError("binary positions hold at most 36 chess pieces")
+
+            piece_codes[piece_count >> 1] |= piece_code << ((piece_count & 1) << 2)
+            piece_count += 1
+            occupied |= 1 << square_index
+
+            if piece_type == "pawn" and chess_piece.get_max_moves() == 2:
+                first_move_pawns |= 1 << square_index
+
+        flags = 1 if self._player_color_turn == "black" else 0
+        special_pieces = 0
+        flag_bit = 1
+        special_shift = 0
+
+        for player_color in ("white", "black"):
 
-        for line_index in range(len(chess_board) - 1, -1, -1):
+            for fairy_piece_type in _FAIRY_PIECE_TYPES:
 
-            chess_board_string = chess_board_string + str(line_index + 1) + " "
+                if fairy_piece_type in self._fairy_pieces_played[player_color]:
+                    flags |= 1 << flag_bit
 
-            for square_location_index in range(0, len(chess_board[line_index])):
+                flag_bit += 1
 
-                square_location = chess_board[line_index][square_location_index]
+            # The queen count takes 1 bit and the other special piece counts take 2 bits each
+            for piece_type in _SPECIAL_PIECE_TYPES:
+                special_pieces |= self._play_fairy_check[player_color][piece_type] << special_shift
+                special_shift += 1 if piece_type == "queen" else 2
 
-                if self._chess_board[square_location] is not None:
-                    piece_symbol = self._chess_board[square_location].get_symbol()
-                    chess_board_string = chess_board_string + "[" + piece_symbol + "]"
+        return struct.pack("<Q18sQBH3x", occupied, bytes(piece_codes), first_move_pawns, flags, special_pieces)
 
-                else:
-                    chess_board_string = chess_board_string + empty_square
+    def set_position_bytes(self, position_bytes):
+        """
+        Sets the chess game to the 40 bytes returned by get_position_bytes. Any bytes-like object such as a memoryview
+        of a memory-mapped file can be given. Raises ValueError if the bytes are not a valid binary position.
+        """
+
+        if len(position_bytes) != POSITION_BYTES:
+            raise ValueError("binary positions must be " + str(POSITION_BYTES) + " bytes")
+
+        occupied, piece_codes, first_move_pawns, flags, special_pieces = struct.unpack("<Q18sQBH3x", position_bytes)
+        board = [None] * 64
+        first_move_squares = set()
+        piece_count = 0
+
+        for square_index in range(64):
+
+            if not occupied >> square_index & 1:
+                continue
+
+            if piece_count >= 36:
+                raise ValueError("binary positions hold at most 36 chess pieces")
+
+            piece_code = piece_codes[piece_count >> 1] >> ((piece_count & 1) << 2) & 15
+            piece_count += 1
+            board[square_index] = _get_chess_piece(PIECE_TYPES[piece_code & 7], "black" if piece_code & 8 else "white")
+
+            if first_move_pawns >> square_index & 1:
+                first_move_squares.add(square_index)
+
+        fairy_pieces_played = {"white": [], "black": []}
+        play_fairy_check = {"white": {}, "black": {}}
+        flag_bit = 1
+
+        for player_color in ("white", "black"):
+
+            for fairy_piece_type in _FAIRY_PIECE_TYPES:
+
+                if flags >> flag_bit & 1:
+                    fairy_pieces_played[player_color].append(fairy_piece_type)
+
+                flag_bit += 1
+
+            for piece_type in _SPECIAL_PIECE_TYPES:
+                count_bits = 1 if piece_type == "queen" else 2
+                count = special_pieces & ((1 << count_bits) - 1)
+
+                if count > (1 if piece_type == "queen" else 2):
+                    raise ValueError("invalid special piece count in binary position: " + str(count) + " " + piece_type)
+
+                play_fairy_check[player_color][piece_type] = count
+                special_pieces >>= count_bits
+
+        self._set_position(
+            board, "black" if flags & 1 else "white", fairy_pieces_played, play_fairy_check, first_move_squares
+        )
+
+    def _set_position(self, board, player_color_turn, fairy_pieces_played, play_fairy_check, first_move_squares):
+        """
+        Replaces the position of the chess game with the given chess board, player turn, entered fairy pieces, special
+        pieces left, and squares of the pawns that still have their first move. Clears the undo entries and computes
+        the game state, position hash, and chess board display again.
+        """
+        king_squares = {"white": None, "black": None}
+
+        for square_index in range(64):
+
+            chess_piece = board[square_index]
+
+            if chess_piece is None:
+                continue
+
+            if chess_piece.get_piece_type() == "king":
+                king_squares[chess_piece.get_player_color()] = square_index
+
+            if chess_piece.get_piece_type() == "pawn":
+                chess_piece.set_max_moves(2 if square_index in first_move_squares else 1)
+
+        if king_squares["white"] is None and king_squares["black"] is None:
+            raise ValueError("a position needs at least one king")
+
+        # Computes the position hash before any attribute is replaced so an invalid position leaves the game unchanged
+        position_hash = _compute_position_hash(board, player_color_turn, fairy_pieces_played, play_fairy_check)
+        self._game_state = "UNFINISHED"
+
+        if king_squares["black"] is None:
+            self._game_state = "WHITE_WON"
+
+        if king_squares["white"] is None:
+            self._game_state = "BLACK_WON"
 
-                if square_location_index == 7:
-                    chess_board_string = chess_board_string + "\n"
+        self._board = board
+        self._player_color_turn = player_color_turn
+        self._fairy_pieces_played = fairy_pieces_played
+        self._play_fairy_check = play_fairy_check
+        self._special_pieces_lost = {
+            player_color: _SPECIAL_PIECE_COUNT - sum(play_fairy_check[player_color].values())
+            for player_color in ("white", "black")
+        }
+        self._move_stack = []
+        self._dirty_display_rows = 0xFF
+        self._position_hash = position_hash
+        self._changed_squares = _ALL_SQUARES
+
+    def is_headless(self):
+        """
+        Returns whether the chess game never prints the chess board or game state.
+        """
+        return self._headless
+
+    def set_headless(self, headless):
+        """
+        Sets whether the chess game never prints the chess board or game state.
+        """
+        self._headless = headless
+
+    def set_move_callback(self, move_callback):
+        """
+        Sets the function called with the chess game and the move's name tuple after every successful move or fairy
+        piece entry, or None to call nothing.
+        """
+        self._move_callback = move_callback
+
+    def set_game_over_callback(self, game_over_callback):
+        """
+        Sets the function called with the chess game and the game state when a king is captured, or None to call
+        nothing.
+        """
+        self._game_over_callback = game_over_callback
+
+    def get_chess_board_display(self):
+        """
+        Returns the string representation of the current chess board. The string of each row is cached and only the
+        rows changed since the last call are created again.
+        """
+
+        if self._dirty_display_rows:
+
+            for row_index in range(8):
+
+                if self._dirty_display_rows >> row_index & 1:
+                    self._display_rows[row_index] = self._create_row_display(row_index)
+
+            self._dirty_display_rows = 0
+            self._chess_board_display = "   a   b   c   d   e   f   g   h\n" + "".join(reversed(self._display_rows))
+
+        return self._chess_board_display
+
+    def _create_row_display(self, row_index):
+        """
+        Creates and returns the string representation of one row of the chess board.
+        """
+        line = [self._rows[row_index], " "]
+        empty_square = "[  ]"
+
+        for square_index in range(row_index * 8, row_index * 8 + 8):
+
+            chess_piece = self._board[square_index]
+
+            if chess_piece is not None:
+                line.append("[" + chess_piece.get_symbol() + "]")
+
+            else:
+                line.append(empty_square)
 
-        return chess_board_string
+        line.append("\n")
+        return "".join(line)
@@ -0,0 +1,780 @@
+# Author: Anthony Prudent
+# GitHub username: AnthonyPrudent
+# Date: 10/17/2026
+# Description: The program generates and probes endgame tables for small endings of the ChessVar variation, such as
+#              king and falcon against king or king, hunter, and pawn against king. Every position of a material set
+#              is numbered by the player turn and the squares of its chess pieces, then solved by retrograde analysis:
+#              positions where a king can be captured are won, and results spread backwards through un-moves one ply
+#              of distance at a time, while captures of other chess pieces look the result up in the table of the
+#              material left. Each position takes two bytes of a memory-mapped table file holding whether the player
+#              of the current turn wins, loses, or draws and the plies left until a king is captured, so a probe is a
+#              single read. Tables assume both players entered both fairy pieces, so no fairy piece can be entered.
+
+import argparse
+import array
+import mmap
+import os
+import struct
+import sys
+import time
+
+from ChessVar import ATTACK_TABLES, PAWN_PUSH_RAYS, PIECE_LETTERS
+
+# Results of a position for the player of the current turn
+WIN = "WIN"
+LOSS = "LOSS"
+DRAW = "DRAW"
+
+# Largest number of chess pieces of a generated table, a table holds two entries for every 64 squares of each piece
+MAX_PIECES = 4
+
+# Header of a table file: the magic bytes, the format version, the number of chess pieces, and the material name
+_HEADER_FORMAT = "<8sII16s"
+_HEADER_BYTES = struct.calcsize(_HEADER_FORMAT)
+_MAGIC = b"CHESSVTB"
+_VERSION = 1
+
+# Extension of table files, which are named after their material such as KFvK.cvtb
+TABLE_EXTENSION = ".cvtb"
+
+# An entry keeps the result in its top two bits and the plies until a king is captured in the other fourteen
+_RESULT_SHIFT = 14
+_DISTANCE_MASK = (1 << _RESULT_SHIFT) - 1
+_WIN_BITS = 1 << _RESULT_SHIFT
+_LOSS_BITS = 2 << _RESULT_SHIFT
+_INVALID_BITS = 3 << _RESULT_SHIFT
+
+# Order of the chess pieces of each player within a material set
+_MATERIAL_ORDER = ("king", "queen", "rook", "bishop", "knight", "falcon", "hunter", "pawn")
+
+# Chess piece type of every letter of a material name
+_LETTER_TYPES = {letter: piece_type for piece_type, letter in PIECE_LETTERS.items()}
+
+# Player colors numbered as in table indexes, white is 0 and black is 1
+_PLAYER_COLORS = ("white", "black")
+
+# Rows a pawn of each player starts on, and rows a pawn of each player can never stand on
+_PAWN_START_ROWS = {"white": 1, "black": 6}
+_PAWN_BACK_ROWS = {"white": 0, "black": 7}
+
+
+def _get_pawn_max_moves(player_color, square_index):
+    """
+    Returns the max moves of a pawn of the player color standing on the square index. Pawns never move backwards, so a
+    pawn on its starting row still has its first move and any other pawn has used it.
+    """
+
+    if square_index >> 3 == _PAWN_START_ROWS[player_color]:
+        return 2
+
+    return 1
+
+
+def _build_push_rays():
+    """
+    Returns a dictionary mapping each player color to a tuple holding, for every square index, the squares a pawn of
+    that color standing there can move forward to, cut to its max moves. Pawns on their back row have no squares.
+    """
+    push_rays = {}
+
+    for player_color in _PLAYER_COLORS:
+
+        square_rays = []
+
+        for square_index in range(64):
+
+            if square_index >> 3 == _PAWN_BACK_ROWS[player_color]:
+                square_rays.append(())
+
+            else:
+                square_rays.append(
+                    PAWN_PUSH_RAYS[player_color][square_index][:_get_pawn_max_moves(player_color, square_index)]
+                )
+
+        push_rays[player_color] = tuple(square_rays)
+
+    return push_rays
+
+
+def _get_quiet_rays(piece_type, player_color):
+    """
+    Returns a tuple holding, for every square index, the rays of squares the piece type and player color can move to
+    without capturing. Pawns only move forward without capturing, so their forward squares form a single ray.
+    """
+
+    if piece_type == "pawn":
+        return tuple((push_ray,) if push_ray else () for push_ray in _PUSH_RAYS[player_color])
+
+    return ATTACK_TABLES[(piece_type, player_color)]
+
+
+def _build_reverse_rays(square_rays):
+    """
+    Returns a tuple holding, for every square index, the rays of squares a chess piece with the given forward rays
+    could have moved from to reach the square, nearest square first. As for forward rays, a square further along a
+    reverse ray is only reached if every square before it is empty.
+    """
+    reverse_steps = [{} for _ in range(64)]
+
+    for source_index in range(64):
+
+        for ray in square_rays[source_index]:
+
+            # Every square of a forward ray is reached by the same step from the square before it
+            step = ray[0] - source_index
+
+            for distance, target_index in enumerate(ray):
+                reverse_steps[target_index].setdefault(step, []).append((distance, source_index))
+
+    reverse_rays = []
+
+    for target_index in range(64):
+
+        rays = []
+
+        for step in sorted(reverse_steps[target_index]):
+            sources = sorted(reverse_steps[target_index][step])
+            rays.append(tuple(source_index for distance, source_index in sources))
+
+        reverse_rays.append(tuple(rays))
+
+    return tuple(reverse_rays)
+
+
+_PUSH_RAYS = _build_push_rays()
+
+
+def parse_material(material):
+    """
+    Returns the tuple of (piece type, player color) pairs of a material name such as "KFvK", white's chess pieces
+    before the "v" and black's after it, sorted in the order used by table indexes. Raises ValueError if the material
+    name is not valid or does not have exactly one king for each player.
+    """
+    player_letters = material.lower().split("v")
+
+    if len(player_letters) != 2:
+        raise ValueError("material must name white's and black's chess pieces around a 'v': " + str(material))
+
+    pieces = []
+
+    for player_color, letters in zip(_PLAYER_COLORS, player_letters):
+
+        piece_types = []
+
+        for letter in letters:
+
+            if letter not in _LETTER_TYPES:
+                raise ValueError("unknown chess piece letter in material: " + letter)
+
+            piece_types.append(_LETTER_TYPES[letter])
+
+        if piece_types.count("king") != 1:
+            raise ValueError("material needs exactly one king for each player: " + str(material))
+
+        piece_types.sort(key=_MATERIAL_ORDER.index)
+        pieces.extend((piece_type, player_color) for piece_type in piece_types)
+
+    return tuple(pieces)
+
+
+def get_material_name(pieces):
+    """
+    Returns the material name, such as "KFvK", of a tuple of (piece type, player color) pairs in table index order.
+    """
+    player_letters = {"white": "", "black": ""}
+
+    for piece_type, player_color in pieces:
+        player_letters[player_color] += PIECE_LETTERS[piece_type].upper()
+
+    return player_letters["white"] + "v" + player_letters["black"]
+
+
+def get_table_path(material, directory="."):
+    """
+    Returns the path of the table file of the material name in the directory.
+    """
+    return os.path.join(directory, get_material_name(parse_material(material)) + TABLE_EXTENSION)
+
+
+def get_index(squares, player_color_turn):
+    """
+    Returns the table index of a position from the square indexes of its chess pieces in table index order and the
+    player color of the current turn. The index is the player turn plus two times the squares read as a base 64 number
+    whose lowest digit is the first chess piece's square.
+    """
+    position_number = 0
+
+    for square_index in reversed(squares):
+        position_number = (position_number << 6) | square_index
+
+    return (position_number << 1) | _PLAYER_COLORS.index(player_color_turn)
+
+
+def _decode_entry(entry):
+    """
+    Returns the tuple of result and plies until a king is captured of a table entry, or None for an invalid position.
+    Draws have a distance of 0.
+    """
+    result_bits = entry & ~_DISTANCE_MASK
+
+    if result_bits == _WIN_BITS:
+        return WIN, entry & _DISTANCE_MASK
+
+    if result_bits == _LOSS_BITS:
+        return LOSS, entry & _DISTANCE_MASK
+
+    if result_bits == _INVALID_BITS:
+        return None
+
+    return DRAW, 0
+
+
+class EndgameTable:
+    """
+    Represents a solved table file of one material set. Keeps the open file, the material, and the memory map its
+    entries are read from, so a probe never reads the whole table.
+    """
+
+    def __init__(self, path):
+        """
+        Opens the table file at the path for probing. Raises ValueError if the file is not a table file.
+        """
+        self._path = path
+        self._file = open(path, "rb")
+        header = self._file.read(_HEADER_BYTES)
+
+        if len(header) != _HEADER_BYTES:
+            self._file.close()
+            raise ValueError("not an endgame table file: " + str(path))
+
+        magic, version, piece_count, material_name = struct.unpack(_HEADER_FORMAT, header)
+
+        if magic != _MAGIC or version != _VERSION:
+            self._file.close()
+            raise ValueError("not an endgame table file: " + str(path))
+
+        self._pieces = parse_material(material_name.rstrip(b"\0").decode("ascii"))
+        entry_count = 2 << (6 * piece_count)
+
+        if len(self._pieces) != piece_count or os.fstat(self._file.fileno()).st_size != _HEADER_BYTES + 2 * entry_count:
+            self._file.close()
+            raise ValueError("endgame table file has the wrong size: " + str(path))
+
+        self._memory_map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._entries = memoryview(self._memory_map)[_HEADER_BYTES:].cast("H")
+
+    def __len__(self):
+        """
+        Returns the number of entries of the endgame table, valid or not.
+        """
+        return len(self._entries)
+
+    def __enter__(self):
+        """
+        Returns the endgame table so it can be used in a with statement.
+        """
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        """
+        Closes the endgame table at the end of a with statement.
+        """
+        self.close()
+
+    def get_path(self):
+        """
+        Returns the path of the table file.
+        """
+        return self._path
+
+    def get_pieces(self):
+        """
+        Returns the tuple of (piece type, player color) pairs of the material in table index order.
+        """
+        return self._pieces
+
+    def get_material_name(self):
+        """
+        Returns the material name of the endgame table, such as "KFvK".
+        """
+        return get_material_name(self._pieces)
+
+    def probe_index(self, index):
+        """
+        Returns the tuple of result and plies until a king is captured of the position at the table index, or None if
+        no valid position has that index.
+        """
+        return _decode_entry(self._entries[index])
+
+    def probe_squares(self, squares, player_color_turn):
+        """
+        Returns the tuple of result and plies until a king is captured of the position with the chess pieces on the
+        square indexes, given in table index order, and the player color of the current turn.
+        """
+        return self.probe_index(get_index(squares, player_color_turn))
+
+    def get_statistics(self):
+        """
+        Returns a dictionary with the number of won, lost, and drawn positions and the most plies until a king is
+        captured in any won position. Reads the whole endgame table.
+        """
+        statistics = {WIN: 0, LOSS: 0, DRAW: 0, "longest": 0}
+
+        for entry in self._entries:
+
+            entry_result = _decode_entry(entry)
+
+            if entry_result is not None:
+                statistics[entry_result[0]] += 1
+
+                if entry_result[0] == WIN:
+                    statistics["longest"] = max(statistics["longest"], entry_result[1])
+
+        return statistics
+
+    def close(self):
+        """
+        Closes the table file.
+        """
+
+        if self._memory_map is not None:
+            self._entries.release()
+            self._memory_map.close()
+            self._memory_map = None
+
+        self._file.close()
+
+
+class EndgameTablebase:
+    """
+    Represents the endgame tables of a directory, opened the first time a position of their material is probed.
+    Communicates with the ChessVar class to read the position of a chess game.
+    """
+
+    def __init__(self, directory=".", max_pieces=MAX_PIECES):
+        """
+        Initializes the tablebase with the directory holding the table files and the largest number of chess pieces of
+        the positions to probe.
+        """
+        self._directory = directory
+        self._max_pieces = max_pieces
+        self._tables = {}
+
+    def get_directory(self):
+        """
+        Returns the directory holding the table files.
+        """
+        return self._directory
+
+    def get_table(self, material):
+        """
+        Returns the endgame table of the material name, or None if its table file does not exist. A missing table is
+        remembered so probes do not look for its file again until refresh is called.
+        """
+        material_name = get_material_name(parse_material(material))
+
+        if material_name not in self._tables:
+
+            path = os.path.join(self._directory, material_name + TABLE_EXTENSION)
+            self._tables[material_name] = EndgameTable(path) if os.path.exists(path) else None
+
+        return self._tables[material_name]
+
+    def probe(self, chess_game):
+        """
+        Returns the tuple of result and plies until a king is captured of the chess game's position for the player of
+        the current turn, or None if the position is not in a table. Only unfinished positions where both players
+        entered both fairy pieces and at most max pieces chess pieces stand on the chess board can be probed.
+        """
+
+        if chess_game.get_game_state() != "UNFINISHED":
+            return None
+
+        if len(chess_game.get_fairy_pieces_played("white")) < 2 or len(chess_game.get_fairy_pieces_played("black")) < 2:
+            return None
+
+        piece_squares = []
+
+        for square_index, chess_piece in enumerate(chess_game.get_board()):
+
+            if chess_piece is None:
+                continue
+
+            if len(piece_squares) == self._max_pieces:
+                return None
+
+            piece_type = chess_piece.get_piece_type()
+            player_color = chess_piece.get_player_color()
+
+            # Tables only hold pawns whose first move matches their row
+            if piece_type == "pawn" and chess_piece.get_max_moves() != _get_pawn_max_moves(player_color, square_index):
+                return None
+
+            piece_squares.append(
+                (_PLAYER_COLORS.index(player_color), _MATERIAL_ORDER.index(piece_type), square_index, piece_type)
+            )
+
+        piece_squares.sort()
+        pieces = tuple((piece_type, _PLAYER_COLORS[color_number]) for color_number, _, _, piece_type in piece_squares)
+        material_name = get_material_name(pieces)
+
+        if material_name in self._tables:
+            endgame_table = self._tables[material_name]
+
+        else:
+            endgame_table = self.get_table(material_name)
+
+        if endgame_table is None:
+            return None
+
+        squares = [square_index for _, _, square_index, _ in piece_squares]
+        return endgame_table.probe_squares(squares, chess_game.get_player_turn())
+
+    def refresh(self):
+        """
+        Forgets the table files found missing so tables generated since they were looked for are opened by the next
+        probe of their material. Opened endgame tables are kept.
+        """
+        self._tables = {
+            material_name: endgame_table
+            for material_name, endgame_table in self._tables.items()
+            if endgame_table is not None
+        }
+
+    def close(self):
+        """
+        Closes every opened endgame table.
+        """
+
+        for endgame_table in self._tables.values():
+
+            if endgame_table is not None:
+                endgame_table.close()
+
+        self._tables = {}
+
+
+def generate_table(material, directory="."):
+    """
+    Solves every position of the material name and writes its table file to the directory, returning the path. The
+    tables of the material left after capturing any chess piece other than a king are generated first if they do not
+    exist, and an existing table file is kept. Raises ValueError if the material has more than MAX_PIECES pieces.
+    """
+    pieces = parse_material(material)
+    path = get_table_path(material, directory)
+
+    if len(pieces) > MAX_PIECES:
+        raise ValueError("tables are generated for at most " + str(MAX_PIECES) + " chess pieces")
+
+    if os.path.exists(path):
+        return path
+
+    # The table of the material left by each capture, None for the kings since capturing one ends the game
+    capture_tables = []
+
+    for piece_number in range(len(pieces)):
+
+        if pieces[piece_number][0] == "king":
+            capture_tables.append(None)
+            continue
+
+        capture_material = get_material_name(pieces[:piece_number] + pieces[piece_number + 1:])
+        capture_tables.append(EndgameTable(generate_table(capture_material, directory)))
+
+    # The table is written to a temporary file and renamed once solved, so a table file is always complete
+    temporary_path = path + ".tmp"
+    entry_count = 2 << (6 * len(pieces))
+
+    with open(temporary_path, "w+b") as table_file:
+
+        table_file.write(struct.pack(
+            _HEADER_FORMAT, _MAGIC, _VERSION, len(pieces), get_material_name(pieces).encode("ascii")
+        ))
+        table_file.truncate(_HEADER_BYTES + 2 * entry_count)
+        memory_map = mmap.mmap(table_file.fileno(), 0)
+        entries = memoryview(memory_map)[_HEADER_BYTES:].cast("H")
+
+        try:
+            _TableGenerator(pieces, capture_tables, entries).solve()
+
+        finally:
+            entries.release()
+            memory_map.flush()
+            memory_map.close()
+
+            for capture_table in capture_tables:
+
+                if capture_table is not None:
+                    capture_table.close()
+
+    os.replace(temporary_path, path)
+    return path
+
+
+class _TableGenerator:
+    """
+    Represents the retrograde analysis of one material set. Keeps the table entries being solved, the number of moves
+    of every unsolved position not yet known to lose, and the positions waiting to be solved at each distance. Unsolved
+    entries hold the longest known distance to a losing move until their position is solved.
+    """
+
+    def __init__(self, pieces, capture_tables, entries):
+        """
+        Initializes the table generator with the material's chess pieces, the table of the material left by capturing
+        each of them, and the zeroed entries to solve.
+        """
+        self._pieces = pieces
+        self._capture_tables = capture_tables
+        self._entries = entries
+        self._piece_count = len(pieces)
+        self._remaining_moves = bytearray(len(entries))
+        self._distance_positions = {}
+        self._colors = tuple(_PLAYER_COLORS.index(player_color) for _, player_color in pieces)
+        self._attack_rays = tuple(ATTACK_TABLES[piece] for piece in pieces)
+        self._reverse_rays = tuple(_build_reverse_rays(_get_quiet_rays(*piece)) for piece in pieces)
+        self._push_rays = tuple(
+            _PUSH_RAYS[player_color] if piece_type == "pawn" else None for piece_type, player_color in pieces
+        )
+
+    def solve(self):
+        """
+        Solves every entry, first from the moves of each position that capture or leave the table and then backwards
+        through un-moves in order of distance. Positions that are never solved are draws.
+        """
+        self._scan_positions()
+        entries = self._entries
+        distance = 1
+
+        while self._distance_positions:
+
+            for index in self._distance_positions.pop(distance, ()):
+                self._solve_predecessors(index, distance)
+
+            distance += 1
+
+        for index in range(len(entries)):
+
+            if entries[index] < _WIN_BITS:
+                entries[index] = 0
+
+    def _schedule(self, index, entry):
+        """
+        Stores the solved entry of the position at the index and queues the position to be solved at its distance.
+        """
+        self._entries[index] = entry
+        self._distance_positions.setdefault(entry & _DISTANCE_MASK, array.array("I")).append(index)
+
+    def _scan_positions(self):
+        """
+        Marks impossible positions as invalid and scans the moves of every other position. Positions that can capture
+        a king, or win by a capture into a smaller table, are queued as wins, and positions whose every move loses are
+        queued as losses. Every other position counts its moves not yet known to lose.
+        """
+        piece_count = self._piece_count
+        pawn_back_rows = tuple(
+            _PAWN_BACK_ROWS[player_color] if piece_type == "pawn" else None for piece_type, player_color in self._pieces
+        )
+        board = [-1] * 64
+
+        for position_number in range(len(self._entries) >> 1):
+
+            squares = [(position_number >> (6 * piece_number)) & 63 for piece_number in range(piece_count)]
+            valid = len(set(squares)) == piece_count
+
+            for piece_number in range(piece_count):
+
+                if squares[piece_number] >> 3 == pawn_back_rows[piece_number]:
+                    valid = False
+
+            if not valid:
+                self._entries[position_number << 1] = _INVALID_BITS
+                self._entries[(position_number << 1) | 1] = _INVALID_BITS
+                continue
+
+            for piece_number in range(piece_count):
+                board[squares[piece_number]] = piece_number
+
+            for color_number in (0, 1):
+                self._scan_moves((position_number << 1) | color_number, board, squares, color_number)
+
+            for square_index in squares:
+                board[square_index] = -1
+
+    def _scan_moves(self, index, board, squares, color_number):
+        """
+        Scans every move of the player numbered by the color number in the position at the index, queueing the position
+        if its result is already known from its captures and counting its moves otherwise.
+        """
+        colors = self._colors
+        quiet_moves = 0
+        open_captures = 0
+        win_distance = None
+        loss_distance = 0
+
+        for piece_number in range(self._piece_count):
+
+            if colors[piece_number] != color_number:
+                continue
+
+            square_index = squares[piece_number]
+            push_rays = self._push_rays[piece_number]
+
+            # Pawns move forward only onto empty squares
+            if push_rays is not None:
+
+                for target_index in push_rays[square_index]:
+
+                    if board[target_index] >= 0:
+                        break
+
+                    quiet_moves += 1
+
+            for ray in self._attack_rays[piece_number][square_index]:
+
+                for target_index in ray:
+
+                    target_number = board[target_index]
+
+                    if target_number < 0:
+
+                        # Pawns only move diagonally when capturing
+                        if push_rays is None:
+                            quiet_moves += 1
+
+                        continue
+
+                    if colors[target_number] != color_number:
+
+                        capture_result = self._get_capture_result(squares, piece_number, target_number, color_number)
+
+                        if capture_result[0] == WIN:
+                            win_distance = capture_result[1] if win_distance is None else min(
+                                win_distance, capture_result[1]
+                            )
+
+                        elif capture_result[0] == LOSS:
+                            loss_distance = max(loss_distance, capture_result[1])
+
+                        else:
+                            open_captures += 1
+
+                    break
+
+        if win_distance is not None:
+            self._schedule(index, _WIN_BITS | win_distance)
+
+        elif quiet_moves + open_captures == 0:
+
+            # A player without any move draws, a player whose every move is a losing capture loses
+            if loss_distance:
+                self._schedule(index, _LOSS_BITS | loss_distance)
+
+        else:
+            self._remaining_moves[index] = quiet_moves + open_captures
+            self._entries[index] = loss_distance
+
+    def _get_capture_result(self, squares, piece_number, target_number, color_number):
+        """
+        Returns the tuple of result and distance for the capturing player of the capture of the chess piece numbered
+        target number by the chess piece numbered piece number. Captures that only draw return a DRAW result.
+        """
+        capture_table = self._capture_tables[target_number]
+
+        # Capturing the king wins on this move
+        if capture_table is None:
+            return WIN, 1
+
+        capture_squares = list(squares)
+        capture_squares[piece_number] = squares[target_number]
+        del capture_squares[target_number]
+        capture_entry = capture_table.probe_squares(capture_squares, _PLAYER_COLORS[1 - color_number])
+
+        if capture_entry[0] == LOSS:
+            return WIN, capture_entry[1] + 1
+
+        if capture_entry[0] == WIN:
+            return LOSS, capture_entry[1] + 1
+
+        return DRAW, 0
+
+    def _solve_predecessors(self, index, distance):
+        """
+        Updates every position that reaches the solved position at the index by a quiet move. Predecessors of a loss
+        are wins one ply further, and a predecessor of a win loses once every one of its moves is known to lose.
+        """
+        entries = self._entries
+        entry = entries[index]
+
+        # The position was queued again at a shorter distance
+        if entry & _DISTANCE_MASK != distance:
+            return
+
+        position_number = index >> 1
+        mover_number = 1 - (index & 1)
+        squares = [(position_number >> (6 * piece_number)) & 63 for piece_number in range(self._piece_count)]
+        occupied = 0
+
+        for square_index in squares:
+            occupied |= 1 << square_index
+
+        for piece_number in range(self._piece_count):
+
+            if self._colors[piece_number] != mover_number:
+                continue
+
+            square_index = squares[piece_number]
+            piece_shift = 1 + 6 * piece_number
+
+            for ray in self._reverse_rays[piece_number][square_index]:
+
+                for source_index in ray:
+
+                    if occupied >> source_index & 1:
+                        break
+
+                    predecessor_index = (index ^ 1) + ((source_index - square_index) << piece_shift)
+                    predecessor_entry = entries[predecessor_index]
+
+                    # A move into a lost position wins one ply later unless a faster win is already known
+                    if entry >= _LOSS_BITS:
+
+                        if predecessor_entry < _WIN_BITS or _WIN_BITS | (distance + 1) < predecessor_entry < _LOSS_BITS:
+                            self._schedule(predecessor_index, _WIN_BITS | (distance + 1))
+
+                    elif predecessor_entry < _WIN_BITS:
+
+                        predecessor_distance = max(predecessor_entry, distance + 1)
+                        self._remaining_moves[predecessor_index] -= 1
+
+                        if self._remaining_moves[predecessor_index] == 0:
+                            self._schedule(predecessor_index, _LOSS_BITS | predecessor_distance)
+
+                        else:
+                            entries[predecessor_index] = predecessor_distance
+
+
+def main(arguments=None):
+    """
+    Generates the endgame tables of the material names from the command line and prints what each table holds.
+    """
+    parser = argparse.ArgumentParser(description="Retrograde endgame table generator for ChessVar endings.")
+    parser.add_argument("materials", nargs="+", help="material names such as KFvK or KHPvK")
+    parser.add_argument("--directory", default=".", help="directory of the table files")
+    options = parser.parse_args(arguments)
+
+    for material in options.materials:
+
+        start_time = time.perf_counter()
+        path = generate_table(material, options.directory)
+
+        with EndgameTable(path) as endgame_table:
+            statistics = endgame_table.get_statistics()
+
+        print(f"{path}: {statistics[WIN]} won, {statistics[LOSS]} lost, {statistics[DRAW]} drawn, longest win "
+              f"{statistics['longest']} plies ({time.perf_counter() - start_time:.1f}s)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+# Author: Anthony Prudent
+# GitHub username: AnthonyPrudent
+# Date: 10/17/2026
+# Description: The program replays logs of ChessVar games without holding a whole log or game in memory. A log has
+#              one move per line, either the current and destination squares such as "e2 e4" or a fairy piece letter
+#              and enter square such as "F c1", and games are separated by blank lines. Lines starting with "#" are
+#              comments. The log is read lazily line by line and every move is made as soon as it is read on a
+#              headless chess game, and a result is yielded as soon as each game ends with its final game state,
+#              the index of its first illegal move, and optionally the position after every move.
+
+import sys
+
+from ChessVar import ChessVar
+
+
+class ReplayResult:
+    """
+    Represents the result of replaying one game of a log. Stores the index of the game in the log, the line number its
+    first move was read from, the number of moves made, the final game state, the index and text of the first illegal
+    move, and the position strings after every move if they were recorded.
+    """
+
+    __slots__ = ("_game_index", "_line_number", "_moves_made", "_game_state", "_illegal_move_index", "_illegal_move",
+                 "_positions")
+
+    def __init__(self, game_index, line_number, moves_made, game_state, illegal_move_index, illegal_move, positions):
+        """
+        Initializes the replay result with the information gathered while replaying the game.
+        """
+        self._game_index = game_index
+        self._line_number = line_number
+        self._moves_made = moves_made
+        self._game_state = game_state
+        self._illegal_move_index = illegal_move_index
+        self._illegal_move = illegal_move
+        self._positions = positions
+
+    def __repr__(self):
+        """
+        Returns the string representation of the replay result.
+        """
+        return (f"ReplayResult(game_index={self._game_index}, moves_made={self._moves_made}, "
+                f"game_state={self._game_state!r}, illegal_move_index={self._illegal_move_index})")
+
+    def get_game_index(self):
+        """
+        Returns the index of the game in the log, starting at 0.
+        """
+        return self._game_index
+
+    def get_line_number(self):
+        """
+        Returns the line number of the game's first move in the log, starting at 1.
+        """
+        return self._line_number
+
+    def get_moves_made(self):
+        """
+        Returns the number of moves made before the game ended or the first illegal move.
+        """
+        return self._moves_made
+
+    def get_game_state(self):
+        """
+        Returns the game state after the last legal move of the game.
+        """
+        return self._game_state
+
+    def get_illegal_move_index(self):
+        """
+        Returns the index of the game's first illegal move starting at 0, or None if every move was legal.
+        """
+        return self._illegal_move_index
+
+    def get_illegal_move(self):
+        """
+        Returns the text of the game's first illegal move, or None if every move was legal.
+        """
+        return self._illegal_move
+
+    def get_positions(self):
+        """
+        Returns the list of position strings after every legal move, or None if positions were not recorded.
+        """
+        return self._positions
+
+
+def replay_games(log, record_positions=False):
+    """
+    Yields a ReplayResult for every game of the log in order. The log is a path to a log file, an open text file, or any
+    iterable of lines. Moves after a game's first illegal move are skipped until the next game starts. Only the game
+    being replayed is kept in memory, plus its positions if record_positions is True.
+    """
+
+    if isinstance(log, str):
+
+        with open(log) as log_file:
+            yield from replay_games(log_file, record_positions)
+
+        return
+
+    game_index = 0
+    chess_game = None
+
+    for line_number, line in enumerate(log, 1):
+
+        move_text = line.strip()
+
+        if move_text.startswith("#"):
+            continue
+
+        # A blank line ends the current game
+        if not move_text:
+
+            if chess_game is not None:
+                yield _create_result(game_index, chess_game)
+                game_index += 1
+                chess_game = None
+
+            continue
+
+        if chess_game is None:
+            chess_game = _ReplayGame(line_number, record_positions)
+
+        chess_game.play(move_text)
+
+    if chess_game is not None:
+        yield _create_result(game_index, chess_game)
+
+
+def replay_moves(moves, game_index=0, record_positions=False):
+    """
+    Returns the ReplayResult of replaying one game given as an iterable of move texts such as "e2 e4" or "F c1".
+    """
+    replay_game = _ReplayGame(1, record_positions)
+
+    for move_text in moves:
+        replay_game.play(move_text.strip())
+
+    return _create_result(game_index, replay_game)
+
+
+def _create_result(game_index, replay_game):
+    """
+    Returns the ReplayResult of the finished replay game.
+    """
+    return ReplayResult(
+        game_index,
+        replay_game.line_number,
+        replay_game.moves_made,
+        replay_game.chess_game.get_game_state(),
+        replay_game.illegal_move_index,
+        replay_game.illegal_move,
+        replay_game.positions
+    )
+
+
+class _ReplayGame:
+    """
+    Represents a game being replayed. Stores the headless chess game and what was learned so far about the game.
+    """
+
+    __slots__ = ("line_number", "chess_game", "moves_made", "illegal_move_index", "illegal_move", "positions")
+
+    def __init__(self, line_number, record_positions):
+        """
+        Initializes the replay game starting at the line number, recording positions if requested.
+        """
+        self.line_number = line_number
+        self.chess_game = ChessVar(headless=True)
+        self.moves_made = 0
+        self.illegal_move_index = None
+        self.illegal_move = None
+        self.positions = [] if record_positions else None
+
+    def play(self, move_text):
+        """
+        Makes the move written in the move text unless an earlier move of the game was illegal.
+        """
+
+        if self.illegal_move_index is not None:
+            return
+
+        move_names = move_text.split()
+        move_made = False
+
+        if len(move_names) == 2 and len(move_names[0]) == 1:
+            move_made = self.chess_game.enter_fairy_piece(move_names[0], move_names[1])
+
+        elif len(move_names) == 2:
+            move_made = self.chess_game.make_move(move_names[0], move_names[1])
+
+        if not move_made:
+            self.illegal_move_index = self.moves_made
+            self.illegal_move = move_text
+            return
+
+        self.moves_made += 1
+
+        if self.positions is not None:
+            self.positions.append(self.chess_game.get_fen())
+
+
+def main(arguments=None):
+    """
+    Replays the log file named on the command line, or standard input, printing one line per game with its index,
+    moves made, final game state, and first illegal move. Returns 1 if any game had an illegal move or 0 otherwise.
+    """
+
+    if arguments is None:
+        arguments = sys.argv[1:]
+
+    log = arguments[0] if arguments else sys.stdin
+    illegal_games = 0
+
+    for result in replay_games(log):
+
+        status = result.get_game_state()
+
+        if result.get_illegal_move_index() is not None:
+            illegal_games += 1
+            status += f" illegal move {result.get_illegal_move_index()}: {result.get_illegal_move()}"
+
+        print(f"game {result.get_game_index()}: {result.get_moves_made()} moves {status}")
+
+    return 1 if illegal_games else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
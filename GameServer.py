@@ -0,0 +1,433 @@
+# Author: Anthony Prudent
+# GitHub username: AnthonyPrudent
+# Date: 10/17/2026
+# Description: The program serves many ChessVar games at once from a single asyncio event loop over a TCP or Unix
+#              socket. Clients send one command per line and receive one reply line per command, such as "NEW" to
+#              start a session, "MOVE 1 e2 e4" to move in session 1, or "SEARCH 1 20000" to ask the engine for a move.
+#              Every session wraps a headless chess game, and finished games are reset and kept in a pool so new
+#              sessions reuse them instead of setting up a new chess board. Engine searches run in a process pool
+#              on a copy of the position sent as a position string, so a slow search never stalls other sessions.
+
+import argparse
+import asyncio
+import concurrent.futures
+import itertools
+import sys
+
+from ChessEngine import ChessEngine
+from ChessVar import ChessVar
+from TranspositionTable import TranspositionTable
+
+# Entries of the transposition table kept by the engine of each search worker process
+_WORKER_TABLE_ENTRIES = 1 << 18
+
+# Longest command line accepted from a client, in bytes
+_MAX_LINE_BYTES = 1024
+
+# Clients waiting to be accepted before new connections are refused
+_LISTEN_BACKLOG = 4096
+
+# Engine of the current search worker process, created by its first search
+_worker_engine = None
+
+
+class GamePool:
+    """
+    Represents a pool of headless chess games ready to be reused. Keeps at most max games recycled chess games, which
+    are reset when they are taken from the pool.
+    """
+
+    def __init__(self, max_games=1024):
+        """
+        Initializes an empty game pool keeping at most max games recycled chess games.
+        """
+        self._max_games = max_games
+        self._chess_games = []
+
+    def __len__(self):
+        """
+        Returns the number of recycled chess games in the game pool.
+        """
+        return len(self._chess_games)
+
+    def get_max_games(self):
+        """
+        Returns the largest number of recycled chess games kept by the game pool.
+        """
+        return self._max_games
+
+    def acquire(self):
+        """
+        Returns a headless chess game in the starting position, reusing a recycled chess game if there is one.
+        """
+
+        if self._chess_games:
+            chess_game = self._chess_games.pop()
+            chess_game.reset()
+            return chess_game
+
+        return ChessVar(headless=True)
+
+    def release(self, chess_game):
+        """
+        Returns the chess game to the game pool so a later session can reuse it. The chess game is dropped instead if
+        the pool is full.
+        """
+
+        if len(self._chess_games) < self._max_games:
+            chess_game.set_move_callback(None)
+            chess_game.set_game_over_callback(None)
+            self._chess_games.append(chess_game)
+
+
+class GameServer:
+    """
+    Represents a game server hosting many chess game sessions. Keeps the sessions by number, the game pool sessions
+    take their chess games from, and the executor running engine searches. Communicates with the ChessVar class to
+    make moves and with the ChessEngine class, through the executor, to search for moves.
+    """
+
+    def __init__(self, max_sessions=10000, game_pool=None, search_executor=None, search_workers=None,
+                 max_search_nodes=1000000):
+        """
+        Initializes the game server with the largest number of open sessions, the game pool to take chess games from,
+        the executor running engine searches, and the largest node budget a client can ask a search for. A new game
+        pool is created if none is given, and a process pool with search workers processes is created the first time
+        a search is requested if no executor is given.
+        """
+
+        if game_pool is None:
+            game_pool = GamePool()
+
+        self._max_sessions = max_sessions
+        self._game_pool = game_pool
+        self._search_executor = search_executor
+        self._owns_search_executor = search_executor is None
+        self._search_workers = search_workers
+        self._max_search_nodes = max_search_nodes
+        self._sessions = {}
+        self._session_numbers = itertools.count(1)
+        self._server = None
+        self._commands = {
+            "NEW": self._new_session,
+            "MOVE": self._make_move,
+            "FAIRY": self._enter_fairy_piece,
+            "STATE": self._get_state,
+            "FEN": self._get_fen,
+            "MOVES": self._get_moves,
+            "SEARCH": self._search,
+            "CLOSE": self._close_session
+        }
+
+    def get_session_count(self):
+        """
+        Returns the number of open sessions.
+        """
+        return len(self._sessions)
+
+    def get_game_pool(self):
+        """
+        Returns the game pool the sessions take their chess games from.
+        """
+        return self._game_pool
+
+    def get_chess_game(self, session_number):
+        """
+        Returns the chess game of the session number, or None if there is no such open session.
+        """
+        return self._sessions.get(session_number)
+
+    async def start(self, host="127.0.0.1", port=8765, path=None):
+        """
+        Starts accepting clients on the host and port, or on the Unix socket path if one is given, and returns the
+        asyncio server.
+        """
+
+        if path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._handle_client, path, limit=_MAX_LINE_BYTES, backlog=_LISTEN_BACKLOG
+            )
+
+        else:
+            self._server = await asyncio.start_server(
+                self._handle_client, host, port, limit=_MAX_LINE_BYTES, backlog=_LISTEN_BACKLOG
+            )
+
+        return self._server
+
+    async def serve_forever(self):
+        """
+        Accepts clients until the game server is closed.
+        """
+
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """
+        Stops accepting clients, closes every session, and shuts down the search executor if the game server created
+        it.
+        """
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+        for session_number in list(self._sessions):
+            self._game_pool.release(self._sessions.pop(session_number))
+
+        if self._owns_search_executor and self._search_executor is not None:
+            self._search_executor.shutdown(cancel_futures=True)
+            self._search_executor = None
+
+    async def handle_command(self, line, client_sessions=None):
+        """
+        Returns the reply line to the command line, starting with "OK" followed by the result, or with "ERROR"
+        followed by the reason the command failed. If a set of client sessions is given, the numbers of the sessions
+        opened by the command are added to it and those of the sessions closed are removed from it.
+        """
+
+        if client_sessions is None:
+            client_sessions = set()
+
+        arguments = line.split()
+
+        if not arguments:
+            return "ERROR empty command"
+
+        command = self._commands.get(arguments[0].upper())
+
+        if command is None:
+            return "ERROR unknown command " + arguments[0]
+
+        try:
+            return await command(arguments[1:], client_sessions)
+
+        except (ValueError, KeyError) as error:
+            return "ERROR " + str(error).strip("'")
+
+        # Any other failure is reported to the client instead of closing its connection
+        except Exception as error:
+            return "ERROR " + type(error).__name__ + " " + str(error)
+
+    async def _handle_client(self, reader, writer):
+        """
+        Reads command lines from a client until it disconnects or sends QUIT, writing the reply to each command. The
+        sessions the client opened and did not close are closed when it disconnects, so their chess games go back to
+        the game pool.
+        """
+        client_sessions = set()
+
+        try:
+
+            while True:
+
+                try:
+                    line = await reader.readline()
+
+                except ValueError:
+                    writer.write(b"ERROR command too long\n")
+                    break
+
+                if not line:
+                    break
+
+                line = line.decode("utf-8", "replace").strip()
+
+                if line.upper() == "QUIT":
+                    break
+
+                reply = await self.handle_command(line, client_sessions)
+                writer.write(reply.encode() + b"\n")
+                await writer.drain()
+
+        except ConnectionError:
+            pass
+
+        finally:
+
+            for session_number in client_sessions:
+
+                if session_number in self._sessions:
+                    self._game_pool.release(self._sessions.pop(session_number))
+
+            writer.close()
+
+    def _get_session(self, arguments, argument_count):
+        """
+        Returns the chess game of the session numbered by the first argument after checking the number of arguments.
+        Raises ValueError if the arguments are wrong and KeyError if there is no such open session.
+        """
+
+        if len(arguments) != argument_count:
+            raise ValueError("expected " + str(argument_count) + " arguments")
+
+        if not arguments[0].isdigit():
+            raise ValueError("invalid session " + arguments[0])
+
+        chess_game = self._sessions.get(int(arguments[0]))
+
+        if chess_game is None:
+            raise KeyError("no session " + arguments[0])
+
+        return chess_game
+
+    async def _new_session(self, arguments, client_sessions):
+        """
+        Opens a session with a chess game in the starting position, replying with its session number.
+        """
+
+        if len(self._sessions) >= self._max_sessions:
+            return "ERROR too many sessions"
+
+        session_number = next(self._session_numbers)
+        self._sessions[session_number] = self._game_pool.acquire()
+        client_sessions.add(session_number)
+        return "OK " + str(session_number)
+
+    async def _make_move(self, arguments, client_sessions):
+        """
+        Moves a chess piece in the session, replying with the game state or ILLEGAL if the move was not made.
+        """
+        chess_game = self._get_session(arguments, 3)
+
+        if not chess_game.make_move(arguments[1], arguments[2]):
+            return "ILLEGAL"
+
+        return "OK " + chess_game.get_game_state()
+
+    async def _enter_fairy_piece(self, arguments, client_sessions):
+        """
+        Enters a fairy piece in the session, replying with the game state or ILLEGAL if the piece was not entered.
+        """
+        chess_game = self._get_session(arguments, 3)
+
+        if not chess_game.enter_fairy_piece(arguments[1], arguments[2]):
+            return "ILLEGAL"
+
+        return "OK " + chess_game.get_game_state()
+
+    async def _get_state(self, arguments, client_sessions):
+        """
+        Replies with the game state of the session.
+        """
+        return "OK " + self._get_session(arguments, 1).get_game_state()
+
+    async def _get_fen(self, arguments, client_sessions):
+        """
+        Replies with the position string of the session.
+        """
+        return "OK " + self._get_session(arguments, 1).get_fen()
+
+    async def _get_moves(self, arguments, client_sessions):
+        """
+        Replies with every legal move of the session separated by commas, such as "OK e2 e4,F c1".
+        """
+        legal_moves = self._get_session(arguments, 1).generate_moves()
+        return "OK " + ",".join(first_name + " " + second_name for first_name, second_name in legal_moves)
+
+    async def _search(self, arguments, client_sessions):
+        """
+        Searches the session's position with a budget of searched nodes in the search executor, replying with the
+        best move or NONE if the player has no legal move. Budgets above the largest node budget of the game server
+        are refused so one client cannot hold a search worker indefinitely. The session can still be used while the
+        search runs.
+        """
+        chess_game = self._get_session(arguments, 2)
+
+        if not arguments[1].isdigit():
+            raise ValueError("invalid node budget " + arguments[1])
+
+        if int(arguments[1]) > self._max_search_nodes:
+            raise ValueError("node budget above " + str(self._max_search_nodes))
+
+        if self._search_executor is None:
+            self._search_executor = concurrent.futures.ProcessPoolExecutor(self._search_workers)
+
+        search_executor = self._search_executor
+        event_loop = asyncio.get_running_loop()
+
+        try:
+            best_move = await event_loop.run_in_executor(
+                search_executor, search_position, chess_game.get_fen(), int(arguments[1])
+            )
+
+        except concurrent.futures.BrokenExecutor:
+
+            # A search process died, so the game server replaces the process pool it created for later searches
+            if self._owns_search_executor and self._search_executor is search_executor:
+                search_executor.shutdown(wait=False)
+                self._search_executor = None
+
+            return "ERROR search workers stopped"
+
+        if best_move is None:
+            return "OK NONE"
+
+        return "OK " + best_move[0] + " " + best_move[1]
+
+    async def _close_session(self, arguments, client_sessions):
+        """
+        Closes the session and returns its chess game to the game pool.
+        """
+        self._get_session(arguments, 1)
+        self._game_pool.release(self._sessions.pop(int(arguments[0])))
+        client_sessions.discard(int(arguments[0]))
+        return "OK"
+
+
+def search_position(fen, max_nodes):
+    """
+    Returns the best move found for the position string within the budget of searched nodes, or None if the player has
+    no legal move. Runs in a search worker process, which keeps one engine and transposition table between searches.
+    """
+    global _worker_engine
+
+    if _worker_engine is None:
+        _worker_engine = ChessEngine(TranspositionTable(_WORKER_TABLE_ENTRIES))
+
+    chess_game = ChessVar(headless=True)
+    chess_game.set_fen(fen)
+    return _worker_engine.search(chess_game, max_nodes=max_nodes)
+
+
+async def _serve(options):
+    """
+    Runs the game server with the command line options until it is interrupted.
+    """
+    game_server = GameServer(
+        options.max_sessions, search_workers=options.search_workers, max_search_nodes=options.max_search_nodes
+    )
+    await game_server.start(options.host, options.port, options.unix)
+
+    try:
+        await game_server.serve_forever()
+
+    finally:
+        await game_server.close()
+
+
+def main(arguments=None):
+    """
+    Starts the game server from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Line protocol server hosting many ChessVar games.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    parser.add_argument("--unix", help="Unix socket path to listen on instead of TCP")
+    parser.add_argument("--max-sessions", type=int, default=10000, help="largest number of open sessions")
+    parser.add_argument("--search-workers", type=int, help="engine search processes, one per core if omitted")
+    parser.add_argument("--max-search-nodes", type=int, default=1000000, help="largest node budget of a search")
+    options = parser.parse_args(arguments)
+
+    try:
+        asyncio.run(_serve(options))
+
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+# Author: Anthony Prudent
+# GitHub username: AnthonyPrudent
+# Date: 10/17/2026
+# Description: The program defines an append-only file of ChessVar positions stored in the fixed-width binary form of
+#              ChessVar.get_position_bytes. The file starts with a 16 byte header followed by one 40 byte record per
+#              position, so any position is found by its index without reading the others. Records are read through a
+#              read-only memory map, returned as memoryview slices without copying, and loaded straight into ChessVar
+#              objects, which lets a single file hold millions of positions.
+
+import mmap
+import os
+import struct
+
+from ChessVar import ChessVar, POSITION_BYTES
+
+# Header of a position store file: the magic bytes, the format version, and the size of each record
+_HEADER_FORMAT = "<8sII"
+_HEADER_BYTES = struct.calcsize(_HEADER_FORMAT)
+_MAGIC = b"CHESSVAR"
+_VERSION = 1
+
+
+class PositionStore:
+    """
+    Represents an append-only file of binary chess positions. Keeps the open file, the number of stored positions,
+    and the memory map used to read them. Communicates with the ChessVar class to encode appended positions and to
+    load stored positions.
+    """
+
+    def __init__(self, path, read_only=False):
+        """
+        Opens the position store file at the path, creating it with an empty header if it does not exist unless the
+        store is read only. A partial position left at the end of the file by an interrupted write is dropped when
+        the store is opened for writing. Raises ValueError if the file is not a position store.
+        """
+        self._path = path
+        self._read_only = read_only
+        self._memory_map = None
+        self._mapped_count = 0
+
+        if read_only:
+            self._file = open(path, "rb")
+
+        else:
+            self._file = open(path, "a+b")
+
+        file_size = os.fstat(self._file.fileno()).st_size
+
+        if file_size == 0 and not read_only:
+            self._file.write(struct.pack(_HEADER_FORMAT, _MAGIC, _VERSION, POSITION_BYTES))
+            self._file.flush()
+            file_size = _HEADER_BYTES
+
+        self._file.seek(0)
+        header = self._file.read(_HEADER_BYTES)
+
+        if len(header) != _HEADER_BYTES or struct.unpack(_HEADER_FORMAT, header) != (_MAGIC, _VERSION, POSITION_BYTES):
+            self._file.close()
+            raise ValueError("not a position store file: " + str(path))
+
+        self._count = (file_size - _HEADER_BYTES) // POSITION_BYTES
+
+        # Drops a partial record left by an interrupted write so appended positions stay aligned to whole records
+        if not read_only and file_size != _HEADER_BYTES + self._count * POSITION_BYTES:
+            self._file.truncate(_HEADER_BYTES + self._count * POSITION_BYTES)
+
+    def __len__(self):
+        """
+        Returns the number of positions in the position store.
+        """
+        return self._count
+
+    def __enter__(self):
+        """
+        Returns the position store so it can be used in a with statement.
+        """
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        """
+        Closes the position store at the end of a with statement.
+        """
+        self.close()
+
+    def get_path(self):
+        """
+        Returns the path of the position store file.
+        """
+        return self._path
+
+    def append(self, chess_game):
+        """
+        Appends the current position of the chess game to the end of the position store, returning its index.
+        """
+        return self.append_bytes(chess_game.get_position_bytes())
+
+    def append_bytes(self, position_bytes):
+        """
+        Appends a binary position returned by ChessVar.get_position_bytes, returning its index.
+        """
+
+        if self._read_only:
+            raise OSError("position store is read only: " + str(self._path))
+
+        if len(position_bytes) != POSITION_BYTES:
+            raise ValueError("binary positions must be " + str(POSITION_BYTES) + " bytes")
+
+        self._file.write(position_bytes)
+        self._count += 1
+        return self._count - 1
+
+    def extend(self, chess_games):
+        """
+        Appends the current position of every chess game in the iterable, returning the number appended.
+        """
+        appended = 0
+
+        for chess_game in chess_games:
+            self.append(chess_game)
+            appended += 1
+
+        return appended
+
+    def flush(self):
+        """
+        Writes every appended position to the file.
+        """
+
+        if not self._read_only:
+            self._file.flush()
+
+    def get_position_bytes(self, index):
+        """
+        Returns a read-only memoryview of the 40 bytes of the position at the index without copying them. Negative
+        indexes count from the end. Raises IndexError if there is no position at the index.
+        """
+
+        if index < 0:
+            index += self._count
+
+        if not 0 <= index < self._count:
+            raise IndexError("position index out of range: " + str(index))
+
+        if index >= self._mapped_count:
+            self._map_file()
+
+        offset = _HEADER_BYTES + index * POSITION_BYTES
+        return memoryview(self._memory_map)[offset:offset + POSITION_BYTES]
+
+    def load_position(self, index, chess_game=None):
+        """
+        Returns a chess game set to the position at the index. The position is loaded into the given chess game, or
+        into a new headless chess game if none is given.
+        """
+
+        if chess_game is None:
+            chess_game = ChessVar(headless=True)
+
+        position_bytes = self.get_position_bytes(index)
+        chess_game.set_position_bytes(position_bytes)
+        position_bytes.release()
+        return chess_game
+
+    def iter_positions(self, start=0, stop=None, chess_game=None):
+        """
+        Yields a chess game set to each position from the start index up to but not including the stop index, or to
+        the end of the position store. If a chess game is given, every position is loaded into that same chess game so
+        no chess game is created while iterating.
+        """
+
+        if stop is None or stop > self._count:
+            stop = self._count
+
+        for index in range(start, stop):
+            yield self.load_position(index, chess_game)
+
+    def close(self):
+        """
+        Writes every appended position and closes the position store file.
+        """
+        self.flush()
+
+        if self._memory_map is not None:
+
+            # Memoryviews returned by get_position_bytes keep the memory map open until they are released
+            try:
+                self._memory_map.close()
+
+            except BufferError:
+                pass
+
+            self._memory_map = None
+
+        self._file.close()
+
+    def _map_file(self):
+        """
+        Maps the position store file into memory again so it covers every appended position. The previous memory map
+        is left to close once no memoryview uses it.
+        """
+        self.flush()
+        self._memory_map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mapped_count = (len(self._memory_map) - _HEADER_BYTES) // POSITION_BYTES
@@ -0,0 +1,107 @@
+# Author: Anthony Prudent
+# GitHub username: AnthonyPrudent
+# Date: 10/17/2026
+# Description: The program defines a transposition table that caches search results for chess game positions keyed by
+#              the 64-bit position hash of the ChessVar class. The table holds a fixed number of slots so its memory
+#              use never grows past the size it was created with, and a replacement policy decides which entry keeps a
+#              slot when two positions map to it.
+
+
+# Kinds of stored values: the exact value, a lower bound from a cutoff, or an upper bound when no move raised alpha
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+# Replacement policies deciding whether a new entry overwrites the entry already stored in its slot
+DEPTH_PREFERRED = "depth_preferred"
+ALWAYS_REPLACE = "always_replace"
+
+
+class TranspositionTable:
+    """
+    Represents a size-bounded cache of search results. Each position hash maps to one slot of a fixed list, and each
+    slot stores a tuple of the position hash, search depth, value, value kind, best move, and the search generation
+    that stored it. Communicates with the search through store and probe using ChessVar position hashes.
+    """
+
+    def __init__(self, max_entries=1 << 20, replacement_policy=DEPTH_PREFERRED):
+        """
+        Initializes the transposition table with the maximum number of entries it holds and the replacement policy.
+        With the depth-preferred policy an entry is only replaced by a search at least as deep, unless it was stored
+        by an earlier search generation. With the always-replace policy the newest entry always takes the slot.
+        """
+
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        if replacement_policy not in (DEPTH_PREFERRED, ALWAYS_REPLACE):
+            raise ValueError("unknown replacement policy: " + str(replacement_policy))
+
+        self._max_entries = max_entries
+        self._replacement_policy = replacement_policy
+        self._slots = [None] * max_entries
+        self._generation = 0
+        self._entry_count = 0
+
+    def get_max_entries(self):
+        """
+        Returns the maximum number of entries the transposition table holds.
+        """
+        return self._max_entries
+
+    def get_replacement_policy(self):
+        """
+        Returns the replacement policy of the transposition table.
+        """
+        return self._replacement_policy
+
+    def get_entry_count(self):
+        """
+        Returns the number of slots currently holding an entry.
+        """
+        return self._entry_count
+
+    def new_search(self):
+        """
+        Starts a new search generation. Entries stored by earlier generations can be replaced by any new entry even
+        under the depth-preferred policy, so deep results from old searches do not fill the table forever.
+        """
+        self._generation += 1
+
+    def clear(self):
+        """
+        Removes every entry from the transposition table.
+        """
+        self._slots = [None] * self._max_entries
+        self._entry_count = 0
+
+    def probe(self, position_hash):
+        """
+        Returns the entry tuple stored for the position hash, or None if the position is not in the table.
+        """
+        entry = self._slots[position_hash % self._max_entries]
+
+        if entry is not None and entry[0] == position_hash:
+            return entry
+
+        return None
+
+    def store(self, position_hash, depth, value, value_kind, best_move):
+        """
+        Stores the search result for the position hash, returning a Boolean value depending on whether the
+        replacement policy allowed the entry to take its slot.
+        """
+        slot_index = position_hash % self._max_entries
+        entry = self._slots[slot_index]
+
+        if entry is None:
+            self._entry_count += 1
+
+        # A deeper result for a different position from the same search keeps its slot
+        elif self._replacement_policy == DEPTH_PREFERRED:
+
+            if entry[0] != position_hash and entry[5] == self._generation and entry[1] > depth:
+                return False
+
+        self._slots[slot_index] = (position_hash, depth, value, value_kind, best_move, self._generation)
+        return True